@@ -10,37 +10,154 @@ This module provides fixtures for:
 - Mock external services (Gemini AI, Storage, Email)
 """
 
+import contextlib
 import io
 import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 from unittest.mock import MagicMock, AsyncMock
 
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 from faker import Faker
 
-from app.main import app
-from app.models.schemas import UserRole, MediaStatus, TagType
+# Initialize Faker for test data generation. Only the internet (email) and
+# person (names) providers are used, and a fixed seed keeps runs reproducible.
+fake = Faker(providers=["faker.providers.internet", "faker.providers.person"])
+fake.seed_instance(0)
 
-# Initialize Faker for test data generation
-fake = Faker()
+
+# ============================================================================
+# Collection Hooks
+# ============================================================================
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Default each test's xdist_group to its module.
+
+    With --dist=loadgroup this keeps a file on one worker (like loadfile) unless
+    a test or class opts into a named group of its own.
+    """
+    for item in items:
+        if item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group(item.nodeid.split("::", 1)[0]))
 
 
 # ============================================================================
 # Application Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_app():
-    """FastAPI application instance for testing."""
+    """
+    FastAPI application instance for testing.
+
+    Imported lazily so runs that never touch the app (e.g. ``-k generators``)
+    skip loading routers, Supabase, Gemini and Resend.
+    """
+    from app.main import app
+
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def _warm_auth_models():
+    """
+    Build and exercise the auth request validators once per session.
+
+    The first EmailStr validation also imports email_validator, so this keeps
+    that one-off cost out of whichever auth test happens to run first.
+
+    No other schema needs warming: none sets defer_build, so pydantic builds
+    every validator when app.models.schemas is imported, which test modules
+    such as tests/utils/test_validators.py already do at collection time.
+    """
+    from app.models.schemas import UserLogin, UserRegister, UserResponse
+
+    for model in (UserRegister, UserLogin, UserResponse):
+        model.model_rebuild()
+
+    UserRegister.model_validate(
+        {"email": "warmup@example.com", "password": "SecurePass123!", "full_name": "Warm Up"}
+    )
+    UserLogin.model_validate({"email": "warmup@example.com", "password": "x"})
+    UserResponse.model_validate(
+        {"id": "warmup", "email": "warmup@example.com", "full_name": "Warm Up", "role": "caregiver"}
+    )
+
+
+@pytest.fixture(scope="session")
 def client(test_app):
-    """TestClient for making HTTP requests to the app."""
-    return TestClient(test_app)
+    """
+    TestClient for making HTTP requests to the app.
+
+    Built once per session (per xdist worker) and entered as a context manager,
+    so the app lifespan runs once rather than per test. Per-test state lives on
+    the app (dependency_overrides, see _reset_dependency_overrides) and in
+    patched modules, not on the client.
+    """
+    with TestClient(test_app) as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def _reset_dependency_overrides(request):
+    """
+    Snapshot test_app.dependency_overrides and restore it after each test.
+
+    Override fixtures just write into the dict and need no teardown. The dict
+    is restored in place because validation_client shares the same object.
+    """
+    if "test_app" not in request.fixturenames:
+        yield
+        return
+    overrides = request.getfixturevalue("test_app").dependency_overrides
+    snapshot = dict(overrides)
+    yield
+    overrides.clear()
+    overrides.update(snapshot)
+
+
+@pytest.fixture(scope="session")
+def validation_client(test_app):
+    """
+    TestClient for a bare app mounting only the health and auth routers.
+
+    No CORS middleware or custom exception handlers, for tests that stop at
+    request validation (422) or never reach business logic. It shares
+    test_app.dependency_overrides, so the auth override fixtures apply here too.
+    """
+    from fastapi import FastAPI
+
+    from app.middleware.rate_limit import limiter
+    from app.routers import auth, health
+
+    app = FastAPI()
+    app.state.limiter = limiter
+    app.dependency_overrides = test_app.dependency_overrides
+    app.include_router(health.router, prefix="/api/health")
+    app.include_router(auth.router, prefix="/api/auth")
+    return TestClient(app, raise_server_exceptions=False)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def aclient(test_app):
+    """
+    Async HTTP client driving the ASGI app in-process.
+
+    Requests go straight into the app via ASGITransport, so there is no
+    TestClient thread/portal per request. Async tests run on the session
+    event loop (see pytest.ini), the same loop this client is bound to:
+
+        async def test_endpoint(aclient):
+            response = await aclient.get("/api/health/")
+    """
+    transport = httpx.ASGITransport(app=test_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
 
 
 # ============================================================================
@@ -50,6 +167,8 @@ def client(test_app):
 @pytest.fixture
 def mock_caregiver_user() -> Dict[str, Any]:
     """Mock authenticated caregiver user."""
+    from app.models.schemas import UserRole
+
     user_id = str(uuid.uuid4())
     return {
         "id": user_id,
@@ -63,6 +182,8 @@ def mock_caregiver_user() -> Dict[str, Any]:
 @pytest.fixture
 def mock_supporter_user() -> Dict[str, Any]:
     """Mock authenticated supporter user."""
+    from app.models.schemas import UserRole
+
     user_id = str(uuid.uuid4())
     return {
         "id": user_id,
@@ -118,6 +239,8 @@ def mock_patient_settings(mock_patient) -> Dict[str, Any]:
 @pytest.fixture
 def mock_media(mock_patient, mock_caregiver_user) -> Dict[str, Any]:
     """Mock media record."""
+    from app.models.schemas import MediaStatus
+
     media_id = str(uuid.uuid4())
     return {
         "id": media_id,
@@ -136,6 +259,8 @@ def mock_media(mock_patient, mock_caregiver_user) -> Dict[str, Any]:
 @pytest.fixture
 def mock_media_tag(mock_media) -> Dict[str, Any]:
     """Mock media tag record."""
+    from app.models.schemas import TagType
+
     tag_id = str(uuid.uuid4())
     return {
         "id": tag_id,
@@ -183,34 +308,33 @@ def mock_invitation(mock_patient, mock_caregiver_user) -> Dict[str, Any]:
 # Mock Supabase Client
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_supabase_response():
-    """Factory for creating mock Supabase query responses."""
-    def _create_response(data: Any = None, error: Any = None):
-        """Create a mock Supabase response object."""
+    """
+    Factory for creating mock Supabase query responses.
+
+    Empty, error-free responses (``data`` of None or ``[]``) are the most common
+    by far and are served from one shared instance; anything carrying data or
+    an error gets a fresh object, since payload dicts are often per-test.
+    """
+    def _build(data: Any, error: Any):
         response = MagicMock()
         response.data = data if data is not None else []
         response.error = error
         return response
-    return _create_response
 
+    empty_response = _build(None, None)
 
-@pytest.fixture
-def mock_supabase(mocker, mock_supabase_response):
-    """
-    Mock Supabase admin client.
+    def _create_response(data: Any = None, error: Any = None):
+        """Create a mock Supabase response object."""
+        if error is None and (data is None or (isinstance(data, list) and not data)):
+            return empty_response
+        return _build(data, error)
+    return _create_response
 
-    Provides mocked responses for common query patterns:
-    - table().select().eq().execute()
-    - table().insert().execute()
-    - table().update().eq().execute()
-    - table().delete().eq().execute()
-    - auth.get_user()
-    - storage.from_().upload()
-    - storage.from_().create_signed_url()
-    """
-    mock_client = MagicMock()
 
+def _configure_supabase_mock(mock_client: MagicMock, make_response) -> None:
+    """Wire the default query, auth and storage behaviour onto mock_client."""
     # Mock query builder chain
     mock_query = MagicMock()
     mock_query.select.return_value = mock_query
@@ -226,7 +350,7 @@ def mock_supabase(mocker, mock_supabase_response):
     mock_query.order.return_value = mock_query
     mock_query.limit.return_value = mock_query
     mock_query.single.return_value = mock_query
-    mock_query.execute.return_value = mock_supabase_response([])
+    mock_query.execute.return_value = make_response([])
 
     # Mock table() method
     mock_client.table.return_value = mock_query
@@ -234,15 +358,15 @@ def mock_supabase(mocker, mock_supabase_response):
     # Mock auth
     mock_auth = MagicMock()
     mock_auth.get_user.return_value = MagicMock(user=None)
-    mock_auth.sign_up.return_value = mock_supabase_response()
-    mock_auth.sign_in_with_password.return_value = mock_supabase_response()
+    mock_auth.sign_up.return_value = make_response()
+    mock_auth.sign_in_with_password.return_value = make_response()
     mock_client.auth = mock_auth
 
     # Mock storage
     mock_storage_bucket = MagicMock()
-    mock_storage_bucket.upload.return_value = mock_supabase_response()
+    mock_storage_bucket.upload.return_value = make_response()
     mock_storage_bucket.download.return_value = b"fake_file_data"
-    mock_storage_bucket.remove.return_value = mock_supabase_response()
+    mock_storage_bucket.remove.return_value = make_response()
     mock_storage_bucket.create_signed_url.return_value = {
         "signedURL": f"https://example.com/signed-url/{uuid.uuid4()}"
     }
@@ -251,43 +375,97 @@ def mock_supabase(mocker, mock_supabase_response):
     mock_storage.from_.return_value = mock_storage_bucket
     mock_client.storage = mock_storage
 
+
+# Fallback for tables a test does not register; shared by every TableRouter and
+# cleared by the table_router fixture.
+_UNUSED_TABLE = MagicMock(name="unused_table")
+
+
+class TableRouter:
+    """
+    Dispatch ``supabase.table(name)`` to per-table query mocks by dict lookup.
+
+    Unregistered tables all get the shared _UNUSED_TABLE fallback:
+
+        table_router.register("patients", patients_q).register("invitations", invitations_q)
+    """
+
+    __slots__ = ("_tables", "_default")
+
+    def __init__(self) -> None:
+        self._tables: Dict[str, Any] = {}
+        self._default = _UNUSED_TABLE
+
+    def register(self, name: str, query: Any) -> "TableRouter":
+        self._tables[name] = query
+        return self
+
+    def __call__(self, name: str) -> Any:
+        return self._tables.get(name, self._default)
+
+
+@pytest.fixture
+def table_router(mock_supabase) -> TableRouter:
+    """Fresh TableRouter installed as mock_supabase.table's side_effect."""
+    _UNUSED_TABLE.reset_mock(return_value=True, side_effect=True)
+    router = TableRouter()
+    mock_supabase.table.side_effect = router
+    return router
+
+
+@pytest.fixture(scope="session")
+def mock_supabase(session_mocker, mock_supabase_response):
+    """
+    Mock Supabase admin client.
+
+    Provides mocked responses for common query patterns:
+    - table().select().eq().execute()
+    - table().insert().execute()
+    - table().update().eq().execute()
+    - table().delete().eq().execute()
+    - auth.get_user()
+    - storage.from_().upload()
+    - storage.from_().create_signed_url()
+
+    Patched in once per session; _reset_supabase_mock restores the defaults
+    above before every test that requests it.
+    """
+    from supabase import Client
+
+    # spec bounds attribute autogeneration to the real client's API
+    mock_client = MagicMock(spec=Client)
+    _configure_supabase_mock(mock_client, mock_supabase_response)
+
+    from app import dependencies
+    from app.routers import auth, media, patients, therapy, voice
+    from app.services import invitations_service, storage_service
+
     # Patch the global supabase_admin client
-    mocker.patch("app.dependencies.supabase_admin", mock_client)
+    session_mocker.patch.object(dependencies, "supabase_admin", mock_client)
 
     # Patch routers that directly import supabase_admin
     # Note: Not all routers import it directly - some use services
-    try:
-        mocker.patch("app.routers.auth.supabase_admin", mock_client)
-    except AttributeError:
-        pass
-
-    try:
-        mocker.patch("app.routers.patients.supabase_admin", mock_client)
-    except AttributeError:
-        pass
-
-    try:
-        mocker.patch("app.routers.media.supabase_admin", mock_client)
-    except AttributeError:
-        pass
-
-    try:
-        mocker.patch("app.routers.therapy.supabase_admin", mock_client)
-    except AttributeError:
-        pass
-
-    try:
-        mocker.patch("app.routers.voice.supabase_admin", mock_client)
-    except AttributeError:
-        pass
+    for router_module in (auth, patients, media, therapy, voice):
+        with contextlib.suppress(AttributeError):
+            session_mocker.patch.object(router_module, "supabase_admin", mock_client)
 
     # Also patch services that use supabase_admin
-    mocker.patch("app.services.invitations_service.supabase_admin", mock_client)
-    mocker.patch("app.services.storage_service.supabase_admin", mock_client)
+    session_mocker.patch.object(invitations_service, "supabase_admin", mock_client)
+    session_mocker.patch.object(storage_service, "supabase_admin", mock_client)
 
     return mock_client
 
 
+@pytest.fixture(autouse=True)
+def _reset_supabase_mock(request, mock_supabase_response):
+    """Clear calls and per-test configuration from the shared mock_supabase."""
+    if "mock_supabase" not in request.fixturenames:
+        return
+    mock_client = request.getfixturevalue("mock_supabase")
+    mock_client.reset_mock(return_value=True, side_effect=True)
+    _configure_supabase_mock(mock_client, mock_supabase_response)
+
+
 # ============================================================================
 # Authentication Dependency Overrides
 # ============================================================================
@@ -312,12 +490,9 @@ def override_get_current_user(test_app, mock_caregiver_user):
         mock_user.user_metadata = {"role": "caregiver"}
         return mock_user
 
+    # Restored after the test by _reset_dependency_overrides
     test_app.dependency_overrides[get_current_user] = _override
-
-    yield _override
-
-    # Cleanup
-    test_app.dependency_overrides.clear()
+    return _override
 
 
 @pytest.fixture
@@ -332,19 +507,23 @@ def override_get_current_user_supporter(test_app, mock_supporter_user):
         mock_user.user_metadata = {"role": "supporter"}
         return mock_user
 
+    # Restored after the test by _reset_dependency_overrides
     test_app.dependency_overrides[get_current_user] = _override
-
-    yield _override
-
-    test_app.dependency_overrides.clear()
+    return _override
 
 
 # ============================================================================
 # Mock External Services
 # ============================================================================
 
+@pytest.fixture(scope="session")
+def _gemini_skeleton():
+    """Gemini model mock built once per session; reset by mock_gemini_client."""
+    return MagicMock()
+
+
 @pytest.fixture
-def mock_gemini_client(mocker):
+def mock_gemini_client(mocker, _gemini_skeleton):
     """
     Mock Google Gemini AI client.
 
@@ -352,13 +531,17 @@ def mock_gemini_client(mocker):
     - google.generativeai.configure()
     - google.generativeai.GenerativeModel()
     - model.generate_content()
+
+    The model mock is shared across the session and reset per test, so call
+    counts never leak between tests.
     """
-    mock_model = MagicMock()
-    mock_response = MagicMock()
-    mock_response.text = "person: Family member (0.95), place: Park (0.85)"
-    mock_model.generate_content.return_value = mock_response
+    from app.services import ai_service
 
-    mock_genai = mocker.patch("app.services.ai_service.genai")
+    mock_model = _gemini_skeleton
+    mock_model.reset_mock(return_value=True, side_effect=True)
+    mock_model.generate_content.return_value.text = "person: Family member (0.95), place: Park (0.85)"
+
+    mock_genai = mocker.patch.object(ai_service, "genai")
     mock_genai.configure.return_value = None
     mock_genai.GenerativeModel.return_value = mock_model
 
@@ -376,16 +559,18 @@ def mock_storage_service(mocker):
     - delete_file()
     - compress_image()
     """
-    mock_upload = mocker.patch("app.services.storage_service.upload_file")
+    from app.services import storage_service
+
+    mock_upload = mocker.patch.object(storage_service, "upload_file")
     mock_upload.return_value = f"media/{uuid.uuid4()}/file.jpg"
 
-    mock_signed_url = mocker.patch("app.services.storage_service.get_signed_url")
+    mock_signed_url = mocker.patch.object(storage_service, "get_signed_url")
     mock_signed_url.return_value = f"https://example.com/signed/{uuid.uuid4()}"
 
-    mock_delete = mocker.patch("app.services.storage_service.delete_file")
+    mock_delete = mocker.patch.object(storage_service, "delete_file")
     mock_delete.return_value = None
 
-    mock_compress = mocker.patch("app.services.storage_service.compress_image")
+    mock_compress = mocker.patch.object(storage_service, "compress_image")
     mock_compress.return_value = b"compressed_image_data"
 
     return {
@@ -396,16 +581,26 @@ def mock_storage_service(mocker):
     }
 
 
+@pytest.fixture(scope="session")
+def _email_send_skeleton():
+    """Resend send() mock built once per session; reset by mock_email_service."""
+    return MagicMock()
+
+
 @pytest.fixture
-def mock_email_service(mocker):
+def mock_email_service(mocker, _email_send_skeleton):
     """
     Mock Resend email service.
 
     Mocks:
     - resend.Emails.send()
     """
-    mock_send = mocker.patch("app.services.email_service.resend.Emails.send")
+    from app.services import email_service
+
+    mock_send = _email_send_skeleton
+    mock_send.reset_mock(return_value=True, side_effect=True)
     mock_send.return_value = {"id": f"email-{uuid.uuid4()}"}
+    mocker.patch.object(email_service.resend.Emails, "send", mock_send)
 
     return mock_send
 
@@ -420,16 +615,26 @@ def fake_image_file():
     return io.BytesIO(b"fake_image_data" * 1000)  # ~15KB
 
 
+@pytest.fixture(scope="session")
+def _large_image_bytes():
+    """6MB payload (over the 5MB upload limit), allocated once per session."""
+    return b"x" * (6 * 1024 * 1024)
+
+
 @pytest.fixture
-def fake_large_image_file():
+def fake_large_image_file(_large_image_bytes):
     """Generate a fake large image file (>5MB) for compression testing."""
-    return io.BytesIO(b"x" * (6 * 1024 * 1024))  # 6MB
+    return io.BytesIO(_large_image_bytes)
 
 
-@pytest.fixture
+# JPEG SOI/APP0 marker followed by padding; uploads are never decoded for real.
+_JPEG_UPLOAD_BYTES = b"\xff\xd8\xff\xe0" + b"\x00" * 1024
+
+
+@pytest.fixture(scope="session")
 def fake_image_upload():
-    """Generate a file upload tuple for multipart/form-data."""
-    return ("test_photo.jpg", b"fake_image_data" * 1000, "image/jpeg")
+    """File upload tuple for multipart/form-data (immutable, shared per session)."""
+    return ("test_photo.jpg", _JPEG_UPLOAD_BYTES, "image/jpeg")
 
 
 # ============================================================================
@@ -0,0 +1,36 @@
+# tests/helpers/fake_supabase.py
+"""
+Lightweight stand-ins for Supabase query builders.
+
+Plain classes rather than MagicMock trees: a chain like
+select().eq().single().execute() costs a few attribute lookups on one object
+instead of synthesizing a child mock per level.
+"""
+
+from typing import Any
+
+
+class FakeQuery:
+    """
+    Query-builder double for one Supabase chain of any shape.
+
+    Every attribute access or call returns the query itself and execute()
+    returns ``result``, so select().eq().is_().limit()... all resolve without
+    configuring each level. Group one per builder verb for a whole table:
+
+        SimpleNamespace(select=FakeQuery(found), update=FakeQuery(updated))
+    """
+
+    __slots__ = ("result",)
+
+    def __init__(self, result: Any) -> None:
+        self.result = result
+
+    def __getattr__(self, name: str) -> "FakeQuery":
+        return self
+
+    def __call__(self, *args, **kwargs) -> "FakeQuery":
+        return self
+
+    def execute(self) -> Any:
+        return self.result
@@ -0,0 +1,75 @@
+# tests/helpers/records.py
+"""
+Module-scoped user, patient and session rows shared by the router tests.
+
+The root conftest builds fresh Faker-backed records for every test; modules
+that only need stable ids import these fixtures instead, which shadow the
+root ones and are built once per test module:
+
+    from tests.helpers.records import FIXED_TS, mock_caregiver_user, mock_patient  # noqa: F401
+
+Rows are read-only; pass dict(row) wherever a router may write into the row
+it is handed (e.g. a query fake's result).
+"""
+
+import uuid
+from types import MappingProxyType
+
+import pytest
+
+# Timestamp for created_at/started_at/ended_at in stub rows; no test needs "now".
+FIXED_TS = "2024-01-01T00:00:00+00:00"
+
+
+@pytest.fixture(scope="module")
+def mock_caregiver_user():
+    """Caregiver shared by the whole module (shadows the root conftest fixture)."""
+    return MappingProxyType({
+        "id": str(uuid.uuid4()),
+        "email": "caregiver@example.com",
+        "full_name": "Test Caregiver",
+        "role": "caregiver",
+        "created_at": FIXED_TS,
+    })
+
+
+@pytest.fixture(scope="module")
+def mock_supporter_user():
+    """Supporter shared by the whole module (shadows the root conftest fixture)."""
+    return MappingProxyType({
+        "id": str(uuid.uuid4()),
+        "email": "supporter@example.com",
+        "full_name": "Test Supporter",
+        "role": "supporter",
+        "created_at": FIXED_TS,
+    })
+
+
+@pytest.fixture(scope="module")
+def mock_patient(mock_caregiver_user):
+    """The module caregiver's patient (shadows the root conftest fixture)."""
+    return MappingProxyType({
+        "id": str(uuid.uuid4()),
+        "caregiver_id": mock_caregiver_user["id"],
+        "first_name": "Mary",
+        "last_name": "Smith",
+        "birth_date": "1945-06-15",
+        "relationship": "Mother",
+        "photo_url": None,
+        "created_at": FIXED_TS,
+    })
+
+
+@pytest.fixture(scope="module")
+def mock_therapy_session(mock_patient, mock_caregiver_user):
+    """An open session for the module patient (shadows the root conftest fixture)."""
+    return MappingProxyType({
+        "id": str(uuid.uuid4()),
+        "patient_id": mock_patient["id"],
+        "started_by": mock_caregiver_user["id"],
+        "voice_enabled": False,
+        "started_at": FIXED_TS,
+        "ended_at": None,
+        "photos_shown": 0,
+        "session_duration_seconds": 0,
+    })
@@ -0,0 +1,167 @@
+# tests/patients/conftest.py
+"""
+Shared fixtures for the patients router tests (app/routers/patients.py).
+
+The router tests are split across sibling modules so pytest-xdist can run them
+on separate workers; module-scoped fixtures here are built once per test module.
+"""
+
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from tests.helpers.fake_supabase import FakeQuery
+from tests.helpers.records import (  # noqa: F401 - fixtures shadow the root conftest ones
+    FIXED_TS,
+    mock_caregiver_user,
+    mock_patient,
+    mock_supporter_user,
+)
+
+# Shared bearer header; TestClient never mutates the dict it is given.
+AUTH_HEADERS = {"Authorization": "Bearer fake-token"}
+
+
+@pytest.fixture(scope="module")
+def patient_urls(mock_patient):
+    """Endpoint paths for the module patient, formatted once."""
+    root = f"/api/patients/{mock_patient['id']}"
+    return SimpleNamespace(
+        root=root,
+        settings=f"{root}/settings",
+        supporters=f"{root}/supporters",
+        photo=f"{root}/photo",
+    )
+
+
+@pytest.fixture(scope="module")
+def new_patient_row(mock_caregiver_user):
+    """Read-only row the patients insert returns in the create tests."""
+    return MappingProxyType({
+        "id": "patient-id",
+        "caregiver_id": mock_caregiver_user["id"],
+        "first_name": "Mary",
+        "last_name": "Smith",
+        "birth_date": "1945-06-15",
+        "relationship": "Mother",
+        "photo_url": None,
+        "created_at": FIXED_TS,
+    })
+
+
+@pytest.fixture(scope="module")
+def supporter_link_rows(mock_patient, mock_supporter_user):
+    """Read-only active patient_supporters rows joined with the supporter profile."""
+    return (
+        MappingProxyType({
+            "id": "link-id",
+            "supporter_id": mock_supporter_user["id"],
+            "patient_id": mock_patient["id"],
+            "created_at": FIXED_TS,
+            "revoked_at": None,
+            "profiles": MappingProxyType({
+                "full_name": mock_supporter_user["full_name"],
+                "email": mock_supporter_user["email"],
+            }),
+        }),
+    )
+
+
+@pytest.fixture(scope="module")
+def auth_overrides(mock_caregiver_user, mock_supporter_user):
+    """get_current_user overrides keyed by role, built once per test module."""
+    def make(user):
+        mock_user = MagicMock()
+        mock_user.id = user["id"]
+        mock_user.email = user["email"]
+        mock_user.user_metadata = {"role": user["role"]}
+
+        async def _override():
+            return mock_user
+        return _override
+
+    return {"caregiver": make(mock_caregiver_user), "supporter": make(mock_supporter_user)}
+
+
+@pytest.fixture(autouse=True)
+def _install_user(request, test_app, auth_overrides):
+    """
+    Authenticate each test as the role from @pytest.mark.user (default caregiver).
+
+    @pytest.mark.user(None) leaves get_current_user alone so the request is
+    unauthenticated; the override is restored by _reset_dependency_overrides.
+    """
+    from app.dependencies import get_current_user
+
+    marker = request.node.get_closest_marker("user")
+    role = marker.args[0] if marker else "caregiver"
+    if role is not None:
+        test_app.dependency_overrides[get_current_user] = auth_overrides[role]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _stub_signed_url():
+    """Stub get_signed_url (used by _sign_patient_photo) once per test module."""
+    with patch("app.routers.patients.get_signed_url", return_value="https://example.com/signed") as stub:
+        yield stub
+
+
+def _fake_table(mock_supabase_response, **verbs):
+    """Table double with a FakeQuery per builder verb given (None = not used)."""
+    return SimpleNamespace(**{
+        verb: FakeQuery(mock_supabase_response(data))
+        for verb, data in verbs.items()
+        if data is not None
+    })
+
+
+@pytest.fixture(scope="module")
+def make_patients_mock(mock_supabase_response):
+    """
+    Factory for patients-table query fakes; only the given chains are set.
+
+    existing: select().eq().execute()         (caregiver's existing patients)
+    single:   select().eq().single().execute() (verify_patient_* lookups)
+    inserted: insert().execute()
+    updated:  update().eq().execute()
+    """
+    def make(existing=None, single=None, inserted=None, updated=None):
+        select = single if single is not None else existing
+        return _fake_table(mock_supabase_response, select=select, insert=inserted, update=updated)
+    return make
+
+
+@pytest.fixture(scope="class")
+def patients_single(make_patients_mock, mock_patient):
+    """patients fake whose single() lookup finds the module patient, shared per class."""
+    return make_patients_mock(single=dict(mock_patient))
+
+
+@pytest.fixture(scope="module")
+def make_settings_mock(mock_supabase_response):
+    """Factory for patient_settings query fakes (single select, insert, update)."""
+    def make(single=None, inserted=None, updated=None):
+        return _fake_table(mock_supabase_response, select=single, insert=inserted, update=updated)
+    return make
+
+
+@pytest.fixture(scope="module")
+def make_supporters_mock(mock_supabase_response):
+    """
+    Factory for patient_supporters query fakes.
+
+    listed:  select().eq().is_().execute()       (active supporters of a patient)
+    linked:  select().eq().eq().is_().execute()  (verify_patient_access supporter check)
+    revoked: update().eq().eq().execute()
+    """
+    def make(listed=None, linked=None, revoked=None):
+        select = linked if linked is not None else listed
+        return _fake_table(mock_supabase_response, select=select, update=revoked)
+    return make
+
+
+@pytest.fixture(scope="module")
+def media_empty_mock(mock_supabase_response):
+    """media query with no photos, for _sign_patient_photo's random-photo lookup."""
+    return _fake_table(mock_supabase_response, select=[])
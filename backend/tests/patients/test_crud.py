@@ -0,0 +1,347 @@
+# tests/patients/test_crud.py
+"""
+Tests for patient CRUD in the patients router (app/routers/patients.py).
+
+Coverage:
+- Create patient (caregiver only, one patient limit)
+- Get patient (access control)
+- Update patient (caregiver only)
+- Supporters rejected from caregiver-only endpoints
+"""
+
+import io
+from types import SimpleNamespace
+
+import pytest
+
+from tests.helpers.fake_supabase import FakeQuery
+from tests.patients.conftest import AUTH_HEADERS
+
+
+@pytest.fixture(scope="module")
+def tiny_jpeg():
+    """Upload tuple for the forbidden photo case; the buffer is rewound per test."""
+    return ("test.jpg", io.BytesIO(b"data"), "image/jpeg")
+
+
+@pytest.fixture(autouse=True)
+def _rewind_tiny_jpeg(tiny_jpeg):
+    """Rewind the shared buffer; httpx reads it to the end when encoding the upload."""
+    tiny_jpeg[1].seek(0)
+
+
+@pytest.mark.unit
+class TestCreatePatient:
+    """Test patient creation endpoints."""
+
+    def test_create_patient_success(
+        self,
+        client,
+        table_router,
+        mock_caregiver_user,
+        make_patients_mock,
+        make_settings_mock,
+        media_empty_mock,
+        new_patient_row,
+    ):
+        """Test successful patient creation by caregiver."""
+        # Table routing: patients (select→empty existing, insert→data), patient_settings (insert), media (select for _sign_patient_photo)
+        # select("id").eq("caregiver_id",...) for the existing check → empty; insert → patient data
+        mock_patients_q = make_patients_mock(existing=[], inserted=[dict(new_patient_row)])
+        mock_settings_q = make_settings_mock(inserted=[{"patient_id": "patient-id"}])
+
+        (
+            table_router
+            .register("patients", mock_patients_q)
+            .register("patient_settings", mock_settings_q)
+            .register("media", media_empty_mock)
+        )
+
+        response = client.post(
+            "/api/patients/",
+            json={
+                "first_name": "Mary",
+                "last_name": "Smith",
+                "birth_date": "1945-06-15",
+                "relationship": "Mother",
+            },
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        expected = {"first_name": "Mary", "last_name": "Smith", "caregiver_id": mock_caregiver_user["id"]}
+        assert {k: data.get(k) for k in expected} == expected
+
+    @pytest.mark.user(None)
+    def test_create_patient_unauthorized(self, client, mock_supabase):
+        """Test patient creation without authentication."""
+        response = client.post(
+            "/api/patients/",
+            json={
+                "first_name": "Mary",
+                "last_name": "Smith",
+                "birth_date": "1945-06-15",
+                "relationship": "Mother",
+            },
+        )
+
+        assert response.status_code == 401
+
+    @pytest.mark.xfail(reason="Endpoint missing role check — supporters should not create patients")
+    @pytest.mark.user("supporter")
+    def test_create_patient_supporter_forbidden(
+        self,
+        client,
+        table_router,
+        make_patients_mock,
+        make_settings_mock,
+        media_empty_mock,
+        new_patient_row,
+    ):
+        """Test supporters cannot create patients."""
+        mock_patients_q = make_patients_mock(existing=[], inserted=[dict(new_patient_row)])
+        mock_settings_q = make_settings_mock(inserted=[{"patient_id": "patient-id"}])
+
+        (
+            table_router
+            .register("patients", mock_patients_q)
+            .register("patient_settings", mock_settings_q)
+            .register("media", media_empty_mock)
+        )
+
+        response = client.post(
+            "/api/patients/",
+            json={
+                "first_name": "Mary",
+                "last_name": "Smith",
+                "birth_date": "1945-06-15",
+                "relationship": "Mother",
+            },
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 403
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            # Missing last_name, birth_date, relationship
+            pytest.param({"first_name": "Mary"}, id="missing-fields"),
+            pytest.param(
+                {
+                    "first_name": "Mary",
+                    "last_name": "Smith",
+                    "birth_date": "not-a-date",
+                    "relationship": "Mother",
+                },
+                id="invalid-birth-date",
+            ),
+        ],
+    )
+    def test_create_patient_bad_input(self, client, payload):
+        """Test patient creation payloads rejected by request validation."""
+        response = client.post(
+            "/api/patients/",
+            json=payload,
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 422
+
+
+@pytest.mark.unit
+class TestGetPatient:
+    """Test get patient endpoints."""
+
+    def test_get_my_patient_success(
+        self,
+        client,
+        table_router,
+        mock_patient,
+        make_patients_mock,
+        media_empty_mock,
+    ):
+        """Test caregiver getting their patient."""
+        # get_my_patient uses current_user.user_metadata.get('role') → 'caregiver'
+        # Then queries patients.select("*").eq("caregiver_id",...).execute() → list result
+        mock_patients_q = make_patients_mock(existing=[dict(mock_patient)])
+
+        (
+            table_router
+            .register("patients", mock_patients_q)
+            .register("media", media_empty_mock)
+        )
+
+        response = client.get(
+            "/api/patients/me",
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        expected = {"id": mock_patient["id"], "first_name": mock_patient["first_name"]}
+        assert {k: data.get(k) for k in expected} == expected
+
+    def test_get_my_patient_not_found(
+        self,
+        client,
+        table_router,
+        mock_supabase_response,
+        make_patients_mock,
+        make_supporters_mock,
+    ):
+        """Test getting patient when caregiver has no patient."""
+        # All table queries return empty
+        mock_patients_q = make_patients_mock(existing=[])
+        mock_supporters_q = make_supporters_mock(listed=[])
+
+        mock_profiles_q = SimpleNamespace(select=FakeQuery(mock_supabase_response(None)))
+
+        (
+            table_router
+            .register("patients", mock_patients_q)
+            .register("patient_supporters", mock_supporters_q)
+            .register("profiles", mock_profiles_q)
+        )
+
+        response = client.get(
+            "/api/patients/me",
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 404
+
+    def test_get_patient_by_id_success(
+        self,
+        client,
+        table_router,
+        mock_patient,
+        patient_urls,
+        patients_single,
+        media_empty_mock,
+    ):
+        """Test getting patient by ID (with access)."""
+        # verify_patient_access uses .single() → returns dict
+        (
+            table_router
+            .register("patients", patients_single)
+            .register("media", media_empty_mock)
+        )
+
+        response = client.get(
+            patient_urls.root,
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == mock_patient["id"]
+
+    @pytest.mark.user("supporter")
+    def test_get_patient_forbidden(
+        self,
+        client,
+        table_router,
+        make_patients_mock,
+        make_supporters_mock,
+    ):
+        """Test supporter cannot access patient they don't support."""
+        # verify_patient_access: patient found but caregiver_id doesn't match, then supporter check fails
+        mock_patients_q = make_patients_mock(single={"id": "some-patient-id", "caregiver_id": "other-user"})
+        mock_supporters_q = make_supporters_mock(linked=[])
+
+        (
+            table_router
+            .register("patients", mock_patients_q)
+            .register("patient_supporters", mock_supporters_q)
+        )
+
+        response = client.get(
+            "/api/patients/some-patient-id",
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code in [403, 404]
+
+
+@pytest.mark.unit
+class TestUpdatePatient:
+    """Test patient update endpoints."""
+
+    def test_update_patient_success(
+        self,
+        client,
+        table_router,
+        mock_patient,
+        patient_urls,
+        mock_caregiver_user,
+        make_patients_mock,
+        media_empty_mock,
+    ):
+        """Test caregiver updating their patient."""
+        updated_patient = {**mock_patient, "first_name": "Jane"}
+
+        # verify_patient_caregiver uses patients.select().eq().single().execute()
+        # then update uses patients.update().eq().execute()
+        mock_patients_q = make_patients_mock(single=dict(mock_patient), updated=[updated_patient])
+
+        (
+            table_router
+            .register("patients", mock_patients_q)
+            .register("media", media_empty_mock)
+        )
+
+        response = client.patch(
+            patient_urls.root,
+            json={"first_name": "Jane"},
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["first_name"] == "Jane"
+
+
+@pytest.mark.unit
+class TestCaregiverOnlyEndpoints:
+    """Test supporters are rejected by verify_patient_caregiver."""
+
+    @pytest.mark.user("supporter")
+    @pytest.mark.parametrize(
+        "method,path,kwargs",
+        [
+            pytest.param("patch", "", {"json": {"first_name": "Jane"}}, id="update-patient"),
+            pytest.param(
+                "patch", "/settings", {"json": {"voice_therapy_enabled": True}}, id="update-settings"
+            ),
+            pytest.param("delete", "/supporters/other-supporter-id", {}, id="revoke-supporter"),
+            # None: upload tiny_jpeg (a fixture, so it can't be built here)
+            pytest.param("post", "/photo", None, id="upload-photo"),
+        ],
+    )
+    def test_supporter_forbidden(
+        self,
+        client,
+        table_router,
+        patient_urls,
+        patients_single,
+        tiny_jpeg,
+        method,
+        path,
+        kwargs,
+    ):
+        """Test supporters cannot update, configure, revoke or upload for a patient."""
+        if kwargs is None:
+            kwargs = {"files": {"file": tiny_jpeg}}
+        # Only patients is routed; every other table shares the router's one fallback mock
+        table_router.register("patients", patients_single)
+
+        response = client.request(
+            method,
+            patient_urls.root + path,
+            headers=AUTH_HEADERS,
+            **kwargs,
+        )
+
+        assert response.status_code == 403
@@ -0,0 +1,53 @@
+# tests/patients/test_photo.py
+"""
+Tests for patient photo upload (app/routers/patients.py).
+"""
+
+import pytest
+from unittest.mock import patch
+
+from tests.patients.conftest import AUTH_HEADERS
+
+
+async def _fake_compress(*args, **kwargs):
+    """compress_image stand-in; nothing asserts on its calls."""
+    return b"compressed"
+
+
+@pytest.mark.unit
+class TestPatientPhotoUpload:
+    """Test patient photo upload endpoint."""
+
+    # compress_image is imported directly in patients.py
+    @patch("app.routers.patients.compress_image", _fake_compress)
+    def test_upload_patient_photo_success(
+        self,
+        client,
+        table_router,
+        mock_patient,
+        patient_urls,
+        fake_image_upload,
+        make_patients_mock,
+        media_empty_mock,
+    ):
+        """Test uploading patient avatar photo."""
+        updated_patient = {**mock_patient, "photo_url": f"profile/photo_{mock_patient['id']}.jpg"}
+
+        # verify_patient_caregiver on patients, compress_image, storage upload, patients update
+        mock_patients_q = make_patients_mock(single=dict(mock_patient), updated=[updated_patient])
+
+        (
+            table_router
+            .register("patients", mock_patients_q)
+            .register("media", media_empty_mock)
+        )
+
+        response = client.post(
+            patient_urls.photo,
+            files={"file": fake_image_upload},
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "photo_url" in data
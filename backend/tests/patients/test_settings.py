@@ -0,0 +1,74 @@
+# tests/patients/test_settings.py
+"""
+Tests for patient settings in the patients router (app/routers/patients.py).
+"""
+
+import pytest
+
+from tests.patients.conftest import AUTH_HEADERS
+
+
+@pytest.mark.unit
+class TestPatientSettings:
+    """Test patient settings endpoints."""
+
+    def test_get_patient_settings_success(
+        self,
+        client,
+        table_router,
+        patient_urls,
+        mock_patient_settings,
+        patients_single,
+        make_settings_mock,
+    ):
+        """Test getting patient settings."""
+        # verify_patient_caregiver on patients table, then settings query on patient_settings table
+        mock_settings_q = make_settings_mock(single=mock_patient_settings)
+
+        (
+            table_router
+            .register("patients", patients_single)
+            .register("patient_settings", mock_settings_q)
+        )
+
+        response = client.get(
+            patient_urls.settings,
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        # Endpoint returns {"settings": data}
+        assert data["settings"]["require_photo_approval"] == True
+        assert data["settings"]["voice_therapy_enabled"] == False
+
+    def test_update_patient_settings_success(
+        self,
+        client,
+        table_router,
+        patient_urls,
+        mock_patient_settings,
+        patients_single,
+        make_settings_mock,
+    ):
+        """Test updating patient settings."""
+        updated_settings = {**mock_patient_settings, "voice_therapy_enabled": True}
+
+        mock_settings_q = make_settings_mock(updated=[updated_settings])
+
+        (
+            table_router
+            .register("patients", patients_single)
+            .register("patient_settings", mock_settings_q)
+        )
+
+        response = client.patch(
+            patient_urls.settings,
+            json={"voice_therapy_enabled": True},
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        # Endpoint returns {"settings": data}
+        assert data["settings"]["voice_therapy_enabled"] == True
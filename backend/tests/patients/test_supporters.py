@@ -0,0 +1,70 @@
+# tests/patients/test_supporters.py
+"""
+Tests for the patient supporters endpoints (app/routers/patients.py).
+"""
+
+import pytest
+
+from tests.patients.conftest import AUTH_HEADERS, FIXED_TS
+
+
+@pytest.mark.unit
+class TestPatientSupporters:
+    """Test patient supporters endpoints."""
+
+    def test_list_supporters_success(
+        self,
+        client,
+        table_router,
+        patient_urls,
+        patients_single,
+        make_supporters_mock,
+        supporter_link_rows,
+    ):
+        """Test caregiver listing patient supporters."""
+        # InvitationsService.list_supporters calls verify_patient_caregiver, then queries patient_supporters
+        # list_supporters pops "profiles" off each row, so hand it copies
+        mock_supporters_q = make_supporters_mock(listed=[dict(row) for row in supporter_link_rows])
+
+        (
+            table_router
+            .register("patients", patients_single)
+            .register("patient_supporters", mock_supporters_q)
+        )
+
+        response = client.get(
+            patient_urls.supporters,
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert isinstance(data, list)
+
+    def test_revoke_supporter_success(
+        self,
+        client,
+        table_router,
+        patient_urls,
+        mock_supporter_user,
+        patients_single,
+        make_supporters_mock,
+    ):
+        """Test caregiver revoking supporter access."""
+        # InvitationsService.revoke_access calls verify_patient_caregiver, then updates patient_supporters
+        mock_supporters_q = make_supporters_mock(
+            revoked=[{"id": "link-id", "revoked_at": FIXED_TS}]
+        )
+
+        (
+            table_router
+            .register("patients", patients_single)
+            .register("patient_supporters", mock_supporters_q)
+        )
+
+        response = client.delete(
+            f"{patient_urls.supporters}/{mock_supporter_user['id']}",
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code in [200, 204]
@@ -12,17 +12,18 @@ Coverage:
 import pytest
 from unittest.mock import patch
 
+from app.services import email_service
+from app.services.email_service import EmailService
+
 
 @pytest.mark.unit
 class TestSendInvitationEmail:
     """Test sending invitation emails."""
 
-    @patch("app.services.email_service.resend")
-    @patch("app.services.email_service.settings")
+    @patch.object(email_service, "resend")
+    @patch.object(email_service, "settings")
     def test_send_invitation_email_success(self, mock_settings, mock_resend):
         """Test successful email send via Resend."""
-        from app.services.email_service import EmailService
-
         mock_settings.RESEND_API_KEY = "test-api-key"
         mock_settings.FROM_EMAIL = "noreply@reminisce.app"
         mock_resend.Emails.send.return_value = {"id": "email-123"}
@@ -40,12 +41,10 @@ class TestSendInvitationEmail:
         assert "ABCD-EFGH-IJKL" in call_args["html"]
         assert "Mary Smith" in call_args["html"]
 
-    @patch("app.services.email_service.resend")
-    @patch("app.services.email_service.settings")
+    @patch.object(email_service, "resend")
+    @patch.object(email_service, "settings")
     def test_send_invitation_email_with_custom_message(self, mock_settings, mock_resend):
         """Test email includes custom personal message."""
-        from app.services.email_service import EmailService
-
         mock_settings.RESEND_API_KEY = "test-api-key"
         mock_settings.FROM_EMAIL = "noreply@reminisce.app"
         mock_resend.Emails.send.return_value = {"id": "email-456"}
@@ -60,12 +59,10 @@ class TestSendInvitationEmail:
         call_args = mock_resend.Emails.send.call_args[0][0]
         assert "Custom message here!" in call_args["html"]
 
-    @patch("app.services.email_service.resend")
-    @patch("app.services.email_service.settings")
+    @patch.object(email_service, "resend")
+    @patch.object(email_service, "settings")
     def test_send_invitation_email_no_personal_message(self, mock_settings, mock_resend):
         """Test email without personal message."""
-        from app.services.email_service import EmailService
-
         mock_settings.RESEND_API_KEY = "test-api-key"
         mock_settings.FROM_EMAIL = "noreply@reminisce.app"
         mock_resend.Emails.send.return_value = {"id": "email-789"}
@@ -79,12 +76,10 @@ class TestSendInvitationEmail:
         # Should still send successfully
         mock_resend.Emails.send.assert_called_once()
 
-    @patch("app.services.email_service.resend")
-    @patch("app.services.email_service.settings")
+    @patch.object(email_service, "resend")
+    @patch.object(email_service, "settings")
     def test_send_invitation_email_api_error(self, mock_settings, mock_resend):
         """Test error handling when Resend API fails."""
-        from app.services.email_service import EmailService
-
         mock_settings.RESEND_API_KEY = "test-api-key"
         mock_settings.FROM_EMAIL = "noreply@reminisce.app"
         mock_resend.Emails.send.side_effect = Exception("API rate limit exceeded")
@@ -98,12 +93,10 @@ class TestSendInvitationEmail:
 
         assert "rate limit" in str(exc_info.value).lower()
 
-    @patch("app.services.email_service.resend")
-    @patch("app.services.email_service.settings")
+    @patch.object(email_service, "resend")
+    @patch.object(email_service, "settings")
     def test_send_invitation_email_invalid_recipient(self, mock_settings, mock_resend):
         """Test error handling for invalid email address."""
-        from app.services.email_service import EmailService
-
         mock_settings.RESEND_API_KEY = "test-api-key"
         mock_settings.FROM_EMAIL = "noreply@reminisce.app"
         mock_resend.Emails.send.side_effect = Exception("Invalid recipient email")
@@ -122,12 +115,10 @@ class TestSendInvitationEmail:
 class TestEmailFallback:
     """Test email fallback behavior when API key not configured."""
 
-    @patch("app.services.email_service.resend")
-    @patch("app.services.email_service.settings")
+    @patch.object(email_service, "resend")
+    @patch.object(email_service, "settings")
     def test_send_email_no_api_key_fallback(self, mock_settings, mock_resend):
         """Test fallback to logging when Resend API key not set."""
-        from app.services.email_service import EmailService
-
         mock_settings.RESEND_API_KEY = None
 
         # Should not raise -- function returns early, logging a warning
@@ -145,12 +136,10 @@ class TestEmailFallback:
 class TestEmailTemplates:
     """Test email template formatting."""
 
-    @patch("app.services.email_service.resend")
-    @patch("app.services.email_service.settings")
+    @patch.object(email_service, "resend")
+    @patch.object(email_service, "settings")
     def test_email_template_contains_required_elements(self, mock_settings, mock_resend):
         """Test email template includes all required elements."""
-        from app.services.email_service import EmailService
-
         mock_settings.RESEND_API_KEY = "test-api-key"
         mock_settings.FROM_EMAIL = "noreply@reminisce.app"
         mock_resend.Emails.send.return_value = {"id": "email-id"}
@@ -171,12 +160,10 @@ class TestEmailTemplates:
         assert "Join us!" in html_content  # Personal message
         assert "Reminisce" in html_content  # App name
 
-    @patch("app.services.email_service.resend")
-    @patch("app.services.email_service.settings")
+    @patch.object(email_service, "resend")
+    @patch.object(email_service, "settings")
     def test_email_subject_line(self, mock_settings, mock_resend):
         """Test email subject line is appropriate."""
-        from app.services.email_service import EmailService
-
         mock_settings.RESEND_API_KEY = "test-api-key"
         mock_settings.FROM_EMAIL = "noreply@reminisce.app"
         mock_resend.Emails.send.return_value = {"id": "email-id"}
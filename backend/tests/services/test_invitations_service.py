@@ -30,11 +30,11 @@ class TestInvitationCodeGeneration:
         """Test that generated codes are unique."""
         from app.utils.generators import generate_invite_code
 
-        # Generate multiple codes
-        codes = [generate_invite_code() for _ in range(100)]
+        # Generate straight into a set -- duplicates collapse on insert
+        codes = {generate_invite_code() for _ in range(100)}
 
         # All codes should be unique
-        assert len(codes) == len(set(codes))
+        assert len(codes) == 100
 
     def test_generate_invite_code_uppercase(self):
         """Test that codes are uppercase for readability."""
@@ -52,9 +52,8 @@ class TestInvitationCodeGeneration:
         # Generate many codes to check character set
         codes = [generate_invite_code() for _ in range(50)]
 
-        # All characters should be alphanumeric
-        all_chars = "".join(codes)
-        assert all(c.isalnum() for c in all_chars)
+        # All characters should be alphanumeric (single pass over the joined string)
+        assert "".join(codes).isalnum()
 
     def test_generate_invite_code_length(self):
         """Test code length is appropriate."""
@@ -13,18 +13,38 @@ Coverage:
 import pytest
 from unittest.mock import MagicMock, patch
 
+from app.services import storage_service
+from app.services.storage_service import (
+    compress_image,
+    delete_file,
+    get_signed_url,
+    upload_file,
+)
+
+# One Supabase mock shared by every storage test class; patched in at class
+# level and reset before each test instead of rebuilt per test.
+_SHARED_SUPABASE = MagicMock()
+
+# Positional args delete_file passes to storage remove(): a one-item path list.
+_DELETE_PATH = "media/patient-id/file.jpg"
+_EXPECTED_REMOVE_ARGS = ([_DELETE_PATH],)
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_supabase():
+    """Clear calls and configured behaviour on the shared Supabase mock."""
+    _SHARED_SUPABASE.reset_mock(return_value=True, side_effect=True)
+
 
 @pytest.mark.unit
+@patch.object(storage_service, "supabase_admin", new=_SHARED_SUPABASE)
 class TestFileUpload:
     """Test file upload functionality."""
 
-    @patch("app.services.storage_service.supabase_admin")
-    async def test_upload_file_success(self, mock_supabase):
+    async def test_upload_file_success(self):
         """Test successful file upload to storage."""
-        from app.services.storage_service import upload_file
-
         # Mock storage upload (returns None on success)
-        mock_supabase.storage.from_.return_value.upload.return_value = None
+        _SHARED_SUPABASE.storage.from_.return_value.upload.return_value = None
 
         result = await upload_file(
             file_content=b"fake_image_data",
@@ -37,16 +57,13 @@ class TestFileUpload:
         assert "filename" in result
         assert result["storage_path"].startswith("media/patient-id/originals/")
         assert result["filename"].endswith(".jpg")
-        mock_supabase.storage.from_.assert_called_with("patient-media")
+        _SHARED_SUPABASE.storage.from_.assert_called_with("patient-media")
 
-    @patch("app.services.storage_service.supabase_admin")
-    async def test_upload_file_error(self, mock_supabase):
+    async def test_upload_file_error(self):
         """Test file upload error handling."""
-        from app.services.storage_service import upload_file
+        _SHARED_SUPABASE.storage.from_.return_value.upload.side_effect = Exception("Storage quota exceeded")
 
-        mock_supabase.storage.from_.return_value.upload.side_effect = Exception("Storage quota exceeded")
-
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match=r"(?i)quota"):
             await upload_file(
                 file_content=b"data",
                 patient_id="patient-id",
@@ -54,16 +71,11 @@ class TestFileUpload:
                 content_type="image/jpeg",
             )
 
-        assert "quota" in str(exc_info.value).lower()
-
-    @patch("app.services.storage_service.supabase_admin")
-    async def test_upload_file_invalid_bucket(self, mock_supabase):
+    async def test_upload_file_invalid_bucket(self):
         """Test upload when storage bucket errors."""
-        from app.services.storage_service import upload_file
-
-        mock_supabase.storage.from_.return_value.upload.side_effect = Exception("Bucket not found")
+        _SHARED_SUPABASE.storage.from_.return_value.upload.side_effect = Exception("Bucket not found")
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match=r"(?i)bucket"):
             await upload_file(
                 file_content=b"data",
                 patient_id="patient-id",
@@ -71,8 +83,6 @@ class TestFileUpload:
                 content_type="image/jpeg",
             )
 
-        assert "bucket" in str(exc_info.value).lower()
-
 
 @pytest.mark.unit
 class TestImageCompression:
@@ -81,8 +91,6 @@ class TestImageCompression:
     @patch("app.services.storage_service.Image")
     async def test_compress_image_large_file(self, mock_image_class):
         """Test compression of large image."""
-        from app.services.storage_service import compress_image
-
         mock_image = MagicMock()
         mock_image.mode = "RGB"
         mock_image_class.open.return_value = mock_image
@@ -92,7 +100,9 @@ class TestImageCompression:
 
         mock_image.save.side_effect = mock_save
 
-        result = await compress_image(b"x" * (6 * 1024 * 1024))
+        # Image.open is mocked and compress_image never checks the input length,
+        # so a small payload stands in for the 6MB original
+        result = await compress_image(b"x" * 64)
 
         assert isinstance(result, bytes)
         assert len(result) > 0
@@ -101,8 +111,6 @@ class TestImageCompression:
     @patch("app.services.storage_service.Image")
     async def test_compress_image_small_file(self, mock_image_class):
         """Test compression of small image -- all images go through compression."""
-        from app.services.storage_service import compress_image
-
         mock_image = MagicMock()
         mock_image.mode = "RGB"
         mock_image_class.open.return_value = mock_image
@@ -120,26 +128,20 @@ class TestImageCompression:
     @patch("app.services.storage_service.Image")
     async def test_compress_image_invalid_format(self, mock_image_class):
         """Test compression of invalid image format."""
-        from app.services.storage_service import compress_image
-
         mock_image_class.open.side_effect = Exception("Cannot identify image file")
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match=r"(?i)image"):
             await compress_image(b"not_an_image")
 
-        assert "image" in str(exc_info.value).lower()
-
 
 @pytest.mark.unit
+@patch.object(storage_service, "supabase_admin", new=_SHARED_SUPABASE)
 class TestSignedURLs:
     """Test signed URL generation."""
 
-    @patch("app.services.storage_service.supabase_admin")
-    def test_get_signed_url_success(self, mock_supabase):
+    def test_get_signed_url_success(self):
         """Test generating signed URL for file."""
-        from app.services.storage_service import get_signed_url
-
-        mock_supabase.storage.from_.return_value.create_signed_url.return_value = {
+        _SHARED_SUPABASE.storage.from_.return_value.create_signed_url.return_value = {
             "signedURL": "https://example.com/signed/file.jpg?token=xyz"
         }
 
@@ -150,14 +152,11 @@ class TestSignedURLs:
 
         assert result.startswith("https://")
         assert "signed" in result
-        mock_supabase.storage.from_.assert_called_once_with("patient-media")
+        _SHARED_SUPABASE.storage.from_.assert_called_once_with("patient-media")
 
-    @patch("app.services.storage_service.supabase_admin")
-    def test_get_signed_url_default_expiry(self, mock_supabase):
+    def test_get_signed_url_default_expiry(self):
         """Test signed URL with default expiration time."""
-        from app.services.storage_service import get_signed_url
-
-        mock_supabase.storage.from_.return_value.create_signed_url.return_value = {
+        _SHARED_SUPABASE.storage.from_.return_value.create_signed_url.return_value = {
             "signedURL": "https://example.com/signed/file.jpg"
         }
 
@@ -167,56 +166,41 @@ class TestSignedURLs:
         assert isinstance(result, str)
         assert result.startswith("https://")
 
-    @patch("app.services.storage_service.supabase_admin")
-    def test_get_signed_url_file_not_found(self, mock_supabase):
+    def test_get_signed_url_file_not_found(self):
         """Test signed URL for non-existent file."""
-        from app.services.storage_service import get_signed_url
-
-        mock_supabase.storage.from_.return_value.create_signed_url.side_effect = Exception("File not found")
+        _SHARED_SUPABASE.storage.from_.return_value.create_signed_url.side_effect = Exception("File not found")
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match=r"(?i)not found"):
             get_signed_url(storage_path="nonexistent.jpg")
 
-        assert "not found" in str(exc_info.value).lower()
-
 
 @pytest.mark.unit
+@patch.object(storage_service, "supabase_admin", new=_SHARED_SUPABASE)
 class TestFileDelete:
     """Test file deletion functionality."""
 
-    @patch("app.services.storage_service.supabase_admin")
-    async def test_delete_file_success(self, mock_supabase):
+    async def test_delete_file_success(self):
         """Test successful file deletion."""
-        from app.services.storage_service import delete_file
-
-        mock_supabase.storage.from_.return_value.remove.return_value = None
+        _SHARED_SUPABASE.storage.from_.return_value.remove.return_value = None
 
-        result = await delete_file(storage_path="media/patient-id/file.jpg")
+        result = await delete_file(storage_path=_DELETE_PATH)
 
         assert result is True
-        mock_supabase.storage.from_.assert_called_once_with("patient-media")
-        mock_supabase.storage.from_.return_value.remove.assert_called_once_with(
-            ["media/patient-id/file.jpg"]
-        )
+        _SHARED_SUPABASE.storage.from_.assert_called_once_with("patient-media")
+        _SHARED_SUPABASE.storage.from_.return_value.remove.assert_called_once_with(*_EXPECTED_REMOVE_ARGS)
 
-    @patch("app.services.storage_service.supabase_admin")
-    async def test_delete_file_not_found(self, mock_supabase):
+    async def test_delete_file_not_found(self):
         """Test deleting non-existent file -- returns False."""
-        from app.services.storage_service import delete_file
-
-        mock_supabase.storage.from_.return_value.remove.side_effect = Exception("File not found")
+        _SHARED_SUPABASE.storage.from_.return_value.remove.side_effect = Exception("File not found")
 
         # delete_file catches all exceptions and returns False
         result = await delete_file(storage_path="nonexistent.jpg")
 
         assert result is False
 
-    @patch("app.services.storage_service.supabase_admin")
-    async def test_delete_file_permission_error(self, mock_supabase):
+    async def test_delete_file_permission_error(self):
         """Test deletion when storage raises permission error -- returns False."""
-        from app.services.storage_service import delete_file
-
-        mock_supabase.storage.from_.return_value.remove.side_effect = Exception("Permission denied")
+        _SHARED_SUPABASE.storage.from_.return_value.remove.side_effect = Exception("Permission denied")
 
         # delete_file catches all exceptions and returns False
         result = await delete_file(storage_path="file.jpg")
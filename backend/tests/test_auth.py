@@ -9,40 +9,73 @@ Coverage:
 - Avatar upload
 """
 
+from unittest.mock import MagicMock, patch
+
 import pytest
-from unittest.mock import MagicMock
+
+from tests.helpers.fake_supabase import FakeQuery
+from tests.helpers.records import mock_caregiver_user  # noqa: F401 - shadows the root conftest fixture
+
+
+@pytest.fixture(scope="module", autouse=True)
+def override_get_current_user(test_app, mock_caregiver_user):
+    """
+    Authenticate every request in this module as mock_caregiver_user.
+
+    Installed once for the whole module instead of per test; tests that need
+    the real dependency clear the overrides with patch.dict.
+    """
+    from app.dependencies import get_current_user
+
+    mock_user = MagicMock()
+    mock_user.id = mock_caregiver_user["id"]
+    mock_user.email = mock_caregiver_user["email"]
+    mock_user.user_metadata = {"role": "caregiver"}
+
+    async def _override():
+        return mock_user
+
+    test_app.dependency_overrides[get_current_user] = _override
+
+    yield _override
+
+    test_app.dependency_overrides.pop(get_current_user, None)
 
 
 @pytest.mark.auth
 class TestRegistration:
     """Test user registration endpoints."""
 
-    def test_register_caregiver_success(self, client, mock_supabase, mock_supabase_response):
-        """Test successful caregiver registration."""
+    @pytest.mark.parametrize(
+        "role,uid,email",
+        [
+            ("caregiver", "new-user-id", "test@example.com"),
+            ("supporter", "supporter-id", "supporter@example.com"),
+        ],
+    )
+    def test_register_success(
+        self, client, mock_supabase, mock_supabase_response, role, uid, email
+    ):
+        """Test successful caregiver and supporter registration."""
+        full_name = f"Test {role.title()}"
+
         # Mock Supabase auth.sign_up response
         mock_auth_response = MagicMock()
-        mock_auth_response.user = MagicMock(id="new-user-id", email="test@example.com")
+        mock_auth_response.user = MagicMock(id=uid, email=email)
         mock_supabase.auth.sign_up.return_value = mock_auth_response
 
         # Mock profile creation
-        profile_data = {
-            "id": "new-user-id",
-            "email": "test@example.com",
-            "full_name": "Test Caregiver",
-            "role": "caregiver",
-        }
-        mock_supabase.table.return_value.insert.return_value.execute.return_value = (
-            mock_supabase_response([profile_data])
-        )
+        profile_data = {"id": uid, "email": email, "full_name": full_name, "role": role}
+        mock_supabase.table.return_value = FakeQuery(mock_supabase_response([profile_data]))
 
         # Make request
         response = client.post(
             "/api/auth/register",
             json={
-                "email": "test@example.com",
+                "email": email,
                 "password": "SecurePass123!",
-                "full_name": "Test Caregiver",
-                "role": "caregiver",
+                "full_name": full_name,
+                "role": role,
             },
         )
 
@@ -50,92 +83,7 @@ class TestRegistration:
         assert response.status_code == 200
         data = response.json()
         assert data["message"] == "User registered successfully"
-        assert data["user_id"] == "new-user-id"
-
-    def test_register_supporter_success(self, client, mock_supabase, mock_supabase_response):
-        """Test successful supporter registration."""
-        mock_auth_response = MagicMock()
-        mock_auth_response.user = MagicMock(id="supporter-id", email="supporter@example.com")
-        mock_supabase.auth.sign_up.return_value = mock_auth_response
-
-        profile_data = {
-            "id": "supporter-id",
-            "email": "supporter@example.com",
-            "full_name": "Test Supporter",
-            "role": "supporter",
-        }
-        mock_supabase.table.return_value.insert.return_value.execute.return_value = (
-            mock_supabase_response([profile_data])
-        )
-
-        response = client.post(
-            "/api/auth/register",
-            json={
-                "email": "supporter@example.com",
-                "password": "SecurePass123!",
-                "full_name": "Test Supporter",
-                "role": "supporter",
-            },
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["message"] == "User registered successfully"
-        assert data["user_id"] == "supporter-id"
-
-    def test_register_invalid_email(self, client, mock_supabase):
-        """Test registration with invalid email format."""
-        response = client.post(
-            "/api/auth/register",
-            json={
-                "email": "not-an-email",
-                "password": "SecurePass123!",
-                "full_name": "Test User",
-                "role": "caregiver",
-            },
-        )
-
-        assert response.status_code == 422  # Validation error
-
-    def test_register_weak_password(self, client, mock_supabase):
-        """Test registration with weak password."""
-        response = client.post(
-            "/api/auth/register",
-            json={
-                "email": "test@example.com",
-                "password": "123",  # Too short
-                "full_name": "Test User",
-                "role": "caregiver",
-            },
-        )
-
-        assert response.status_code == 422
-
-    def test_register_missing_fields(self, client, mock_supabase):
-        """Test registration with missing required fields."""
-        response = client.post(
-            "/api/auth/register",
-            json={
-                "email": "test@example.com",
-                # Missing password, full_name, role
-            },
-        )
-
-        assert response.status_code == 422
-
-    def test_register_invalid_role(self, client, mock_supabase):
-        """Test registration with invalid role."""
-        response = client.post(
-            "/api/auth/register",
-            json={
-                "email": "test@example.com",
-                "password": "SecurePass123!",
-                "full_name": "Test User",
-                "role": "admin",  # Invalid role
-            },
-        )
-
-        assert response.status_code == 422
+        assert data["user_id"] == uid
 
     def test_register_duplicate_email(self, client, mock_supabase):
         """Test registration with already registered email."""
@@ -159,7 +107,9 @@ class TestRegistration:
 class TestLogin:
     """Test user login endpoints."""
 
-    def test_login_success(self, client, mock_supabase, mock_supabase_response, mock_caregiver_user):
+    def test_login_success(
+        self, client, mock_supabase, mock_supabase_response, mock_caregiver_user
+    ):
         """Test successful login."""
         # Mock Supabase auth.sign_in_with_password
         mock_session = MagicMock()
@@ -174,9 +124,7 @@ class TestLogin:
         mock_supabase.auth.sign_in_with_password.return_value = mock_auth_response
 
         # Mock profile fetch
-        mock_supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(mock_caregiver_user)
-        )
+        mock_supabase.table.return_value = FakeQuery(mock_supabase_response(dict(mock_caregiver_user)))
 
         response = client.post(
             "/api/auth/login",
@@ -221,25 +169,64 @@ class TestLogin:
 
         assert response.status_code in [400, 401]
 
-    def test_login_missing_email(self, client, mock_supabase):
-        """Test login with missing email."""
-        response = client.post(
-            "/api/auth/login",
-            json={
-                "password": "Password123!",
-            },
-        )
-
-        assert response.status_code == 422
 
-    def test_login_missing_password(self, client, mock_supabase):
-        """Test login with missing password."""
-        response = client.post(
-            "/api/auth/login",
-            json={
-                "email": "test@example.com",
-            },
-        )
+@pytest.mark.auth
+class TestAuthValidation:
+    """Test request validation on the register and login endpoints."""
+
+    @pytest.mark.parametrize(
+        "path,payload",
+        [
+            pytest.param(
+                "/api/auth/register",
+                {
+                    "email": "not-an-email",
+                    "password": "SecurePass123!",
+                    "full_name": "Test User",
+                    "role": "caregiver",
+                },
+                id="register-invalid-email",
+            ),
+            pytest.param(
+                "/api/auth/register",
+                {
+                    "email": "test@example.com",
+                    "password": "123",  # Too short
+                    "full_name": "Test User",
+                    "role": "caregiver",
+                },
+                id="register-weak-password",
+            ),
+            pytest.param(
+                "/api/auth/register",
+                {"email": "test@example.com"},  # Missing password, full_name, role
+                id="register-missing-fields",
+            ),
+            pytest.param(
+                "/api/auth/register",
+                {
+                    "email": "test@example.com",
+                    "password": "SecurePass123!",
+                    "full_name": "Test User",
+                    "role": "admin",  # Invalid role
+                },
+                id="register-invalid-role",
+            ),
+            pytest.param(
+                "/api/auth/login",
+                {"password": "Password123!"},
+                id="login-missing-email",
+            ),
+            pytest.param(
+                "/api/auth/login",
+                {"email": "test@example.com"},
+                id="login-missing-password",
+            ),
+        ],
+    )
+    def test_validation_422(self, validation_client, path, payload):
+        """Test malformed register/login payloads are rejected before Supabase."""
+        response = validation_client.post(path, json=payload)
 
         assert response.status_code == 422
 
@@ -249,13 +236,16 @@ class TestGetProfile:
     """Test get current user profile endpoint."""
 
     def test_get_profile_success(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_caregiver_user
+        self,
+        client,
+        override_get_current_user,
+        mock_supabase,
+        mock_supabase_response,
+        mock_caregiver_user,
     ):
         """Test getting current user profile."""
         # Mock profile fetch
-        mock_supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(mock_caregiver_user)
-        )
+        mock_supabase.table.return_value = FakeQuery(mock_supabase_response(dict(mock_caregiver_user)))
 
         response = client.get(
             "/api/auth/me",
@@ -267,9 +257,10 @@ class TestGetProfile:
         assert data["email"] == mock_caregiver_user["email"]
         assert data["role"] == "caregiver"
 
-    def test_get_profile_unauthorized(self, client, mock_supabase):
+    def test_get_profile_unauthorized(self, client, test_app):
         """Test getting profile without authentication."""
-        response = client.get("/api/auth/me")
+        with patch.dict(test_app.dependency_overrides, clear=True):
+            response = client.get("/api/auth/me")
 
         assert response.status_code == 401
 
@@ -292,16 +283,10 @@ class TestAvatarUpload:
         # Mock storage upload
         avatar_path = f"profile/{mock_caregiver_user['id']}.jpg"
 
-        # Mock profile update (upload_avatar calls .update().eq().execute())
-        mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response({"id": mock_caregiver_user["id"], "avatar_url": avatar_path})
-        )
-
-        # Mock profile fetch for get_me() which calls .select().eq().single().execute()
+        # upload_avatar ignores the .update().eq().execute() result, then get_me()
+        # re-reads the profile via .select().eq().single().execute()
         updated_profile = {**mock_caregiver_user, "avatar_url": avatar_path}
-        mock_supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(updated_profile)
-        )
+        mock_supabase.table.return_value = FakeQuery(mock_supabase_response(updated_profile))
 
         response = client.post(
             "/api/auth/avatar",
@@ -313,27 +298,26 @@ class TestAvatarUpload:
         data = response.json()
         assert "avatar_url" in data
 
-    def test_upload_avatar_no_file(self, client, override_get_current_user, mock_supabase):
+    def test_upload_avatar_no_file(self, validation_client, override_get_current_user):
         """Test avatar upload without file."""
-        response = client.post(
+        response = validation_client.post(
             "/api/auth/avatar",
             headers={"Authorization": "Bearer fake-token"},
         )
 
         assert response.status_code == 422
 
-    def test_upload_avatar_unauthorized(self, client, mock_supabase):
+    def test_upload_avatar_unauthorized(self, client, test_app):
         """Test avatar upload without authentication."""
-        response = client.post(
-            "/api/auth/avatar",
-            files={"file": ("test.jpg", b"data", "image/jpeg")},
-        )
+        with patch.dict(test_app.dependency_overrides, clear=True):
+            response = client.post(
+                "/api/auth/avatar",
+                files={"file": ("test.jpg", b"data", "image/jpeg")},
+            )
 
         assert response.status_code == 401
 
-    def test_upload_avatar_invalid_file_type(
-        self, client, override_get_current_user, mock_supabase
-    ):
+    def test_upload_avatar_invalid_file_type(self, client, override_get_current_user):
         """Test avatar upload with invalid file type."""
         response = client.post(
             "/api/auth/avatar",
@@ -4,25 +4,42 @@ Tests for health check router (app/routers/health.py).
 
 Coverage:
 - Health check endpoint (no authentication required)
+
+PYTEST_DONT_REWRITE: plain asserts only; skip assertion rewriting on import.
 """
 
 import pytest
+from fastapi.routing import APIRoute
+
+
+def _dependency_calls(dependant):
+    """Yield every dependency callable in a route's dependency tree."""
+    for sub in dependant.dependencies:
+        yield sub.call
+        yield from _dependency_calls(sub)
+
+
+@pytest.fixture(scope="module")
+def health_route(test_app) -> APIRoute:
+    """The mounted /api/health/ route, looked up once per module."""
+    return next(
+        route
+        for route in test_app.routes
+        if isinstance(route, APIRoute) and route.path == "/api/health/"
+    )
 
 
 class TestHealthCheck:
     """Test health check endpoint."""
 
-    def test_health_check_success(self, client):
-        """Test health check returns 200 OK."""
-        response = client.get("/api/health/")
+    def test_health_check_success(self, validation_client, health_route):
+        """Test health check returns 200 OK and requires no authentication."""
+        from app.dependencies import get_current_user
 
-        assert response.status_code == 200
-        data = response.json()
-        assert "status" in data
-
-    def test_health_check_no_auth_required(self, client):
-        """Test health check is accessible without authentication."""
         # No Authorization header
-        response = client.get("/api/health/")
+        response = validation_client.get("/api/health/")
 
         assert response.status_code == 200
+        data = response.json()
+        assert "status" in data
+        assert get_current_user not in set(_dependency_calls(health_route.dependant))
@@ -7,150 +7,218 @@ Coverage:
 - Accept invitation (supporter joins)
 - Invitation code validation
 - Email integration
+
+PYTEST_DONT_REWRITE: plain asserts only; skip assertion rewriting on import.
 """
 
+import orjson
 import pytest
-from unittest.mock import MagicMock
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+# Fixed timestamps for invitation rows; no assertion depends on the exact time,
+# and expires_at only has to be in the future for the accept flow.
+_NOW = datetime.now(timezone.utc)
+_NOW_ISO = _NOW.isoformat()
+_EXPIRES_ISO = (_NOW + timedelta(days=7)).isoformat()
+
+# Static request bodies are serialized once at import and sent as raw content.
+_AUTH_JSON_HEADERS = {"Authorization": "Bearer fake-token", "content-type": "application/json"}
+_JSON_HEADERS = {"content-type": "application/json"}
+_ACCEPT_BODY = orjson.dumps(
+    {"email": "test@example.com", "password": "SecurePass123!", "full_name": "Test User"}
+)
+_ACCEPT_NEW_SUPPORTER_BODY = orjson.dumps(
+    {"email": "newsupporter@example.com", "password": "SecurePass123!", "full_name": "New Supporter"}
+)
+
+
+# ============================================================================
+# Query builders (module-scoped factories; each call returns a fresh query)
+# ============================================================================
+
+def _chain(*methods, result):
+    """
+    Plain callable standing in for one query-builder method.
+
+    Calling it, then each of ``methods`` in turn, then ``execute()`` returns
+    ``result``. These tests only read return values, never call history, so
+    SimpleNamespace/lambda chains replace MagicMock's per-attribute children.
+    """
+    node = SimpleNamespace(execute=lambda: result)
+    for name in reversed(methods):
+        node = SimpleNamespace(**{name: lambda *args, _next=node, **kwargs: _next})
+    return lambda *args, _next=node, **kwargs: _next
+
+
+@pytest.fixture(scope="module")
+def patients_query_factory(mock_supabase_response):
+    """patients query whose select().eq().single().execute() returns patient."""
+    def make(patient):
+        return SimpleNamespace(
+            select=_chain("eq", "single", result=mock_supabase_response(patient)),
+        )
+    return make
+
+
+@pytest.fixture(scope="module")
+def invitations_query_factory(mock_supabase_response):
+    """
+    invitations query for the create/accept flows.
+
+    pending: rows from select().eq(code).eq(status).execute()
+    inserted: rows from insert().execute()
+    accepted: rows from update().eq().execute()
+    """
+    def make(pending=None, inserted=None, accepted=None):
+        q = SimpleNamespace()
+        if pending is not None:
+            q.select = _chain("eq", "eq", result=mock_supabase_response(pending))
+        if inserted is not None:
+            q.insert = _chain(result=mock_supabase_response(inserted))
+        if accepted is not None:
+            q.update = _chain("eq", result=mock_supabase_response(accepted))
+        return q
+    return make
+
+
+@pytest.fixture(scope="module")
+def profiles_query_factory(mock_supabase_response):
+    """profiles query: select().eq().execute() -> existing, insert().execute() -> inserted."""
+    def make(existing, inserted):
+        return SimpleNamespace(
+            select=_chain("eq", result=mock_supabase_response(existing)),
+            insert=_chain(result=mock_supabase_response(inserted)),
+        )
+    return make
+
+
+@pytest.fixture(scope="module")
+def supporters_query_factory(mock_supabase_response):
+    """patient_supporters query: select().eq().eq().execute() -> existing, insert() -> inserted."""
+    def make(existing, inserted):
+        return SimpleNamespace(
+            select=_chain("eq", "eq", result=mock_supabase_response(existing)),
+            insert=_chain(result=mock_supabase_response(inserted)),
+        )
+    return make
 
 
 @pytest.mark.integration
 class TestCreateInvitation:
     """Test invitation creation endpoints."""
 
+    @pytest.mark.xdist_group("invitations_create")
+    @pytest.mark.parametrize(
+        "body,override_fixture,patient_found,expected_status",
+        [
+            # verify_patient_caregiver checks caregiver_id match; supporter's ID won't match
+            pytest.param(
+                orjson.dumps({"patient_id": "patient-id", "email": "another@example.com"}),
+                "override_get_current_user_supporter",
+                True,
+                403,
+                id="supporter-forbidden",
+            ),
+            pytest.param(
+                orjson.dumps({"personal_message": "Join us!"}),  # Missing patient_id, email
+                "override_get_current_user",
+                True,
+                422,
+                id="missing-fields",
+            ),
+            pytest.param(
+                orjson.dumps({"patient_id": "patient-id", "email": "not-an-email"}),
+                "override_get_current_user",
+                True,
+                422,
+                id="invalid-email",
+            ),
+            # verify_patient_caregiver returns no data
+            pytest.param(
+                orjson.dumps({"patient_id": "invalid-patient-id", "email": "supporter@example.com"}),
+                "override_get_current_user",
+                False,
+                404,
+                id="invalid-patient",
+            ),
+        ],
+    )
+    def test_create_invitation(
+        self,
+        request,
+        client,
+        table_router,
+        patients_query_factory,
+        mock_patient,
+        body,
+        override_fixture,
+        patient_found,
+        expected_status,
+    ):
+        """Test invitation creation is rejected across caller roles and payloads."""
+        # Every case authenticates, so the 422 cases fail on the body alone.
+        request.getfixturevalue(override_fixture)
+
+        # None of these cases gets past verify_patient_caregiver (.single())
+        table_router.register(
+            "patients", patients_query_factory(mock_patient if patient_found else None)
+        )
+
+        response = client.post("/api/invitations/", content=body, headers=_AUTH_JSON_HEADERS)
+
+        assert response.status_code == expected_status
+
     def test_create_invitation_success(
         self,
         client,
         override_get_current_user,
-        mock_supabase,
-        mock_supabase_response,
+        table_router,
+        patients_query_factory,
+        invitations_query_factory,
         mock_email_service,
         mock_patient,
     ):
-        """Test caregiver creating invitation for supporter."""
-        # Service calls verify_patient_caregiver (.single()) then inserts invitation
-        invitation_data = {
-            "id": "invitation-id",
+        """Test caregiver invites a supporter to their own patient."""
+        payload = {
             "patient_id": mock_patient["id"],
             "email": "supporter@example.com",
-            "invite_code": "ABCD-EFGH-IJKL",
             "personal_message": "Please join!",
-            "status": "pending",
-            "expires_at": (datetime.now(timezone.utc) + timedelta(days=7)).isoformat(),
-            "created_at": datetime.now(timezone.utc).isoformat(),
         }
 
-        mock_patients_q = MagicMock()
-        mock_patients_q.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(mock_patient)
-        )
-
-        mock_invitations_q = MagicMock()
-        mock_invitations_q.insert.return_value.execute.return_value = (
-            mock_supabase_response([invitation_data])
+        # Service calls verify_patient_caregiver (.single()) then inserts invitation
+        mock_invitations_q = invitations_query_factory(inserted=[
+            {
+                "id": "invitation-id",
+                **payload,
+                "invite_code": "ABCD-EFGH-IJKL",
+                "status": "pending",
+                "expires_at": _EXPIRES_ISO,
+                "created_at": _NOW_ISO,
+            }
+        ])
+
+        (
+            table_router
+            .register("patients", patients_query_factory(mock_patient))
+            .register("invitations", mock_invitations_q)
         )
 
-        def table_router(name):
-            if name == "patients":
-                return mock_patients_q
-            if name == "invitations":
-                return mock_invitations_q
-            return MagicMock()
-
-        mock_supabase.table.side_effect = table_router
-
         response = client.post(
             "/api/invitations/",
-            json={
-                "patient_id": mock_patient["id"],
-                "email": "supporter@example.com",
-                "personal_message": "Please join!",
-            },
+            json=payload,
             headers={"Authorization": "Bearer fake-token"},
         )
 
         assert response.status_code == 200
         data = response.json()
+        assert data["patient_id"] == mock_patient["id"]
         assert data["email"] == "supporter@example.com"
         assert "invite_code" in data
 
-    def test_create_invitation_supporter_forbidden(
-        self, client, override_get_current_user_supporter, mock_supabase, mock_supabase_response, mock_patient
-    ):
-        """Test supporters cannot create invitations — verify_patient_caregiver rejects them."""
-        # verify_patient_caregiver checks caregiver_id match; supporter's ID won't match
-        mock_patients_q = MagicMock()
-        mock_patients_q.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(mock_patient)
-        )
-
-        mock_supabase.table.side_effect = lambda name: mock_patients_q if name == "patients" else MagicMock()
-
-        response = client.post(
-            "/api/invitations/",
-            json={
-                "patient_id": mock_patient["id"],
-                "email": "another@example.com",
-            },
-            headers={"Authorization": "Bearer fake-token"},
-        )
-
-        assert response.status_code == 403
-
-    def test_create_invitation_missing_fields(
-        self, client, override_get_current_user, mock_supabase
-    ):
-        """Test creating invitation with missing required fields."""
-        response = client.post(
-            "/api/invitations/",
-            json={
-                # Missing patient_id, email
-                "personal_message": "Join us!",
-            },
-            headers={"Authorization": "Bearer fake-token"},
-        )
-
-        assert response.status_code == 422
-
-    def test_create_invitation_invalid_email(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_patient
-    ):
-        """Test creating invitation with invalid email format."""
-        response = client.post(
-            "/api/invitations/",
-            json={
-                "patient_id": mock_patient["id"],
-                "email": "not-an-email",
-            },
-            headers={"Authorization": "Bearer fake-token"},
-        )
-
-        assert response.status_code == 422
-
-    def test_create_invitation_invalid_patient(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response
-    ):
-        """Test creating invitation for non-existent patient."""
-        # verify_patient_caregiver returns no data
-        mock_patients_q = MagicMock()
-        mock_patients_q.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(None)
-        )
-        mock_supabase.table.side_effect = lambda name: mock_patients_q if name == "patients" else MagicMock()
-
-        response = client.post(
-            "/api/invitations/",
-            json={
-                "patient_id": "invalid-patient-id",
-                "email": "supporter@example.com",
-            },
-            headers={"Authorization": "Bearer fake-token"},
-        )
-
-        assert response.status_code in [403, 404]
-
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("invitations_accept")
 class TestAcceptInvitation:
     """Test invitation acceptance endpoints."""
 
@@ -158,7 +226,10 @@ class TestAcceptInvitation:
         self,
         client,
         mock_supabase,
-        mock_supabase_response,
+        table_router,
+        invitations_query_factory,
+        profiles_query_factory,
+        supporters_query_factory,
         mock_invitation,
     ):
         """Test accepting invitation — creates new supporter account."""
@@ -167,59 +238,36 @@ class TestAcceptInvitation:
             **mock_invitation,
             "invite_code": mock_invitation["code"],
             "status": "pending",
-            "expires_at": (datetime.now(timezone.utc) + timedelta(days=7)).isoformat(),
+            "expires_at": _EXPIRES_ISO,
         }
 
-        # Table routing for the complex accept flow
-        mock_invitations_q = MagicMock()
-        # select().eq().eq().execute() — service queries by invite_code and status
-        mock_invitations_q.select.return_value.eq.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([invitation_with_expiry])
+        # Table routing for the complex accept flow: the service queries by
+        # invite_code and status, then marks the invitation accepted
+        mock_invitations_q = invitations_query_factory(
+            pending=[invitation_with_expiry],
+            accepted=[{**invitation_with_expiry, "status": "accepted"}],
         )
-        # update().eq().execute() — mark as accepted
-        mock_invitations_q.update.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([{**invitation_with_expiry, "status": "accepted"}])
+        mock_profiles_q = profiles_query_factory(existing=[], inserted=[{"id": "new-user-id"}])
+        mock_supporters_q = supporters_query_factory(
+            existing=[],
+            inserted=[{"patient_id": mock_invitation["patient_id"], "supporter_id": "new-user-id"}],
         )
 
-        mock_profiles_q = MagicMock()
-        mock_profiles_q.select.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([])
+        (
+            table_router
+            .register("invitations", mock_invitations_q)
+            .register("profiles", mock_profiles_q)
+            .register("patient_supporters", mock_supporters_q)
         )
-        mock_profiles_q.insert.return_value.execute.return_value = (
-            mock_supabase_response([{"id": "new-user-id"}])
-        )
-
-        mock_supporters_q = MagicMock()
-        mock_supporters_q.select.return_value.eq.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([])
-        )
-        mock_supporters_q.insert.return_value.execute.return_value = (
-            mock_supabase_response([{"patient_id": mock_invitation["patient_id"], "supporter_id": "new-user-id"}])
-        )
-
-        def table_router(name):
-            if name == "invitations":
-                return mock_invitations_q
-            if name == "profiles":
-                return mock_profiles_q
-            if name == "patient_supporters":
-                return mock_supporters_q
-            return MagicMock()
-
-        mock_supabase.table.side_effect = table_router
 
         # Mock auth.sign_up for new account creation
-        mock_auth_response = MagicMock()
-        mock_auth_response.user = MagicMock(id="new-user-id")
+        mock_auth_response = SimpleNamespace(user=SimpleNamespace(id="new-user-id"))
         mock_supabase.auth.sign_up.return_value = mock_auth_response
 
         response = client.post(
             f"/api/invitations/{mock_invitation['code']}/accept",
-            json={
-                "email": "newsupporter@example.com",
-                "password": "SecurePass123!",
-                "full_name": "New Supporter",
-            },
+            content=_ACCEPT_NEW_SUPPORTER_BODY,
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code == 200
@@ -227,93 +275,53 @@ class TestAcceptInvitation:
         assert data["message"] == "Invitation accepted"
         assert "user_id" in data
 
-    def test_accept_invitation_not_found(
-        self, client, mock_supabase, mock_supabase_response
+    @pytest.mark.parametrize(
+        "code,override_fixture,body",
+        [
+            pytest.param(
+                "INVALID-CODE",
+                None,
+                _ACCEPT_BODY,
+                id="not-found",
+            ),
+            # The service queries .eq("status", "pending") — used invitations have status "accepted"
+            pytest.param(
+                "USED-CODE-XXXX",
+                None,
+                _ACCEPT_BODY,
+                id="already-used",
+            ),
+            # Endpoint does not require auth — invalid code returns 404, not 401
+            pytest.param(
+                "ABCD-EFGH-IJKL",
+                None,
+                _ACCEPT_BODY,
+                id="no-auth-required",
+            ),
+            pytest.param(
+                "ABCD-EFGH-IJKL",
+                "override_get_current_user",
+                orjson.dumps({
+                    "email": "caregiver@example.com",
+                    "password": "SecurePass123!",
+                    "full_name": "Caregiver Name",
+                }),
+                id="invalid-code-with-auth",
+            ),
+        ],
+    )
+    def test_accept_invitation_no_pending_match(
+        self, request, client, table_router, invitations_query_factory, code, override_fixture, body
     ):
-        """Test accepting non-existent invitation code."""
-        # Invitations query returns empty
-        mock_invitations_q = MagicMock()
-        mock_invitations_q.select.return_value.eq.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([])
-        )
-        mock_supabase.table.side_effect = lambda name: mock_invitations_q if name == "invitations" else MagicMock()
-
-        response = client.post(
-            "/api/invitations/INVALID-CODE/accept",
-            json={
-                "email": "test@example.com",
-                "password": "SecurePass123!",
-                "full_name": "Test User",
-            },
-        )
-
-        assert response.status_code == 404
-
-    def test_accept_invitation_already_used(
-        self,
-        client,
-        mock_supabase,
-        mock_supabase_response,
-        mock_invitation,
-    ):
-        """Test accepting already used invitation — query filters by status=pending so returns empty."""
-        # The service queries .eq("status", "pending") — used invitations have status "accepted"
-        mock_invitations_q = MagicMock()
-        mock_invitations_q.select.return_value.eq.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([])
-        )
-        mock_supabase.table.side_effect = lambda name: mock_invitations_q if name == "invitations" else MagicMock()
-
-        response = client.post(
-            f"/api/invitations/{mock_invitation['code']}/accept",
-            json={
-                "email": "test@example.com",
-                "password": "SecurePass123!",
-                "full_name": "Test User",
-            },
-        )
-
-        # Returns 404 because the pending-status filter returns no results
-        assert response.status_code == 404
+        """Test accepting a code with no pending invitation returns 404, with or without auth."""
+        if override_fixture:
+            request.getfixturevalue(override_fixture)
 
-    def test_accept_invitation_no_auth_required(self, client, mock_supabase, mock_supabase_response):
-        """Test accept endpoint works without auth (returns 404 for invalid code, not 401)."""
-        mock_invitations_q = MagicMock()
-        mock_invitations_q.select.return_value.eq.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([])
-        )
-        mock_supabase.table.side_effect = lambda name: mock_invitations_q if name == "invitations" else MagicMock()
+        # Invitations query returns empty
+        mock_invitations_q = invitations_query_factory(pending=[])
+        table_router.register("invitations", mock_invitations_q)
 
-        response = client.post(
-            "/api/invitations/ABCD-EFGH-IJKL/accept",
-            json={
-                "email": "test@example.com",
-                "password": "SecurePass123!",
-                "full_name": "Test User",
-            },
-        )
-
-        # Endpoint does not require auth — invalid code returns 404, not 401
-        assert response.status_code == 404
-
-    def test_accept_invitation_invalid_code_with_auth(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_invitation
-    ):
-        """Test accepting invitation with invalid code returns 404 regardless of auth state."""
-        mock_invitations_q = MagicMock()
-        mock_invitations_q.select.return_value.eq.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([])
-        )
-        mock_supabase.table.side_effect = lambda name: mock_invitations_q if name == "invitations" else MagicMock()
-
-        response = client.post(
-            f"/api/invitations/{mock_invitation['code']}/accept",
-            json={
-                "email": "caregiver@example.com",
-                "password": "SecurePass123!",
-                "full_name": "Caregiver Name",
-            },
-        )
+        response = client.post(f"/api/invitations/{code}/accept", content=body, headers=_JSON_HEADERS)
 
         assert response.status_code == 404
 
@@ -323,7 +331,14 @@ class TestInvitationValidation:
     """Test invitation validation and business rules."""
 
     def test_invitation_code_format(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_patient, mock_email_service
+        self,
+        client,
+        override_get_current_user,
+        table_router,
+        patients_query_factory,
+        invitations_query_factory,
+        mock_patient,
+        mock_email_service,
     ):
         """Test invitation code is generated in correct format."""
         invitation_data = {
@@ -332,29 +347,19 @@ class TestInvitationValidation:
             "email": "test@example.com",
             "invite_code": "ABCD-EFGH-IJKL",
             "status": "pending",
-            "expires_at": (datetime.now(timezone.utc) + timedelta(days=7)).isoformat(),
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "expires_at": _EXPIRES_ISO,
+            "created_at": _NOW_ISO,
         }
 
-        mock_patients_q = MagicMock()
-        mock_patients_q.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(mock_patient)
-        )
+        mock_patients_q = patients_query_factory(mock_patient)
+        mock_invitations_q = invitations_query_factory(inserted=[invitation_data])
 
-        mock_invitations_q = MagicMock()
-        mock_invitations_q.insert.return_value.execute.return_value = (
-            mock_supabase_response([invitation_data])
+        (
+            table_router
+            .register("patients", mock_patients_q)
+            .register("invitations", mock_invitations_q)
         )
 
-        def table_router(name):
-            if name == "patients":
-                return mock_patients_q
-            if name == "invitations":
-                return mock_invitations_q
-            return MagicMock()
-
-        mock_supabase.table.side_effect = table_router
-
         response = client.post(
             "/api/invitations/",
             json={
@@ -374,16 +379,14 @@ class TestInvitationValidation:
         self,
         client,
         override_get_current_user,
-        mock_supabase,
-        mock_supabase_response,
+        table_router,
+        patients_query_factory,
+        invitations_query_factory,
         mock_patient,
         mock_email_service,
     ):
         """Test creating multiple invitations for same patient is allowed."""
-        mock_patients_q = MagicMock()
-        mock_patients_q.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(mock_patient)
-        )
+        mock_patients_q = patients_query_factory(mock_patient)
 
         invitation1 = {
             "id": "inv-1",
@@ -391,8 +394,8 @@ class TestInvitationValidation:
             "email": "user1@example.com",
             "invite_code": "CODE-ONE-XXXX",
             "status": "pending",
-            "expires_at": (datetime.now(timezone.utc) + timedelta(days=7)).isoformat(),
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "expires_at": _EXPIRES_ISO,
+            "created_at": _NOW_ISO,
         }
         invitation2 = {
             "id": "inv-2",
@@ -400,24 +403,15 @@ class TestInvitationValidation:
             "email": "user2@example.com",
             "invite_code": "CODE-TWO-YYYY",
             "status": "pending",
-            "expires_at": (datetime.now(timezone.utc) + timedelta(days=7)).isoformat(),
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "expires_at": _EXPIRES_ISO,
+            "created_at": _NOW_ISO,
         }
 
-        mock_invitations_q = MagicMock()
-
-        def table_router(name):
-            if name == "patients":
-                return mock_patients_q
-            if name == "invitations":
-                return mock_invitations_q
-            return MagicMock()
-
-        mock_supabase.table.side_effect = table_router
-
         # First invitation
-        mock_invitations_q.insert.return_value.execute.return_value = (
-            mock_supabase_response([invitation1])
+        (
+            table_router
+            .register("patients", mock_patients_q)
+            .register("invitations", invitations_query_factory(inserted=[invitation1]))
         )
 
         response1 = client.post(
@@ -431,9 +425,7 @@ class TestInvitationValidation:
         assert response1.status_code == 200
 
         # Second invitation
-        mock_invitations_q.insert.return_value.execute.return_value = (
-            mock_supabase_response([invitation2])
-        )
+        table_router.register("invitations", invitations_query_factory(inserted=[invitation2]))
 
         response2 = client.post(
             "/api/invitations/",
@@ -9,21 +9,95 @@ Coverage:
 - Tag management (add, delete)
 - Delete media
 - File type validation
-"""
 
-import uuid
+All tests are async and share the session-scoped aclient; the auth override
+and the mock_supabase table wiring they install are reset after each test by
+the conftest autouse fixtures, so no test needs its own teardown.
+"""
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+# Shared request constants; TestClient never mutates the headers dict it is given.
+_AUTH_HEADERS = {"Authorization": "Bearer fake-token"}
+_NONEXISTENT_ID = "00000000-0000-0000-0000-000000000000"
+
+_MULTIPART_BOUNDARY = "media-test-boundary"
+
+
+def _encode_multipart(fields, files):
+    """Encode form fields and (filename, bytes, mime) files as multipart/form-data."""
+    parts = [
+        f'--{_MULTIPART_BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        for name, value in fields.items()
+    ]
+    for name, (filename, content, mime) in files.items():
+        parts.append(
+            f'--{_MULTIPART_BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"; '
+            f'filename="{filename}"\r\nContent-Type: {mime}\r\n\r\n'.encode()
+            + content
+            + b"\r\n"
+        )
+    parts.append(f"--{_MULTIPART_BOUNDARY}--\r\n".encode())
+    return b"".join(parts)
+
+
+# Upload bodies for test_upload_photo_rejected, encoded once instead of by httpx
+# per request; none of them is read past validation or the first failed insert.
+_MULTIPART_CONTENT_TYPE = f"multipart/form-data; boundary={_MULTIPART_BOUNDARY}"
+_REJECT_BODY = _encode_multipart(
+    {"patient_id": "invalid-patient-id"}, {"files": ("test.jpg", b"data", "image/jpeg")}
+)
+_NO_PATIENT_BODY = _encode_multipart({}, {"files": ("test.jpg", b"data", "image/jpeg")})
+_EXE_BODY = _encode_multipart(
+    {"patient_id": "invalid-patient-id"}, {"files": ("test.exe", b"binary", "application/exe")}
+)
+
+
+def _query_mock(chain, result):
+    """
+    Query mock whose table().<chain>().execute() returns result.
+
+    chain names the builder calls, e.g. "select.eq.single"; the whole path is
+    set in one configure_mock call rather than walked attribute by attribute.
+    """
+    path = ".return_value.".join([*chain.split("."), "execute"]) + ".return_value"
+    return MagicMock(**{path: result})
+
+
+# compress_image and analyze_image are imported directly into media.py, so they
+# are patched there. Each AsyncMock is installed once per module and reset by
+# the classes that use it.
+@pytest.fixture(scope="module")
+def compress_image():
+    """AsyncMock standing in for app.routers.media.compress_image."""
+    mock = AsyncMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.routers.media.compress_image", mock)
+        yield mock
+
+
+@pytest.fixture(scope="module")
+def analyze_image():
+    """AsyncMock standing in for app.routers.media.analyze_image."""
+    mock = AsyncMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.routers.media.analyze_image", mock)
+        yield mock
+
 
 @pytest.mark.media
 class TestMediaUpload:
     """Test media upload endpoints."""
 
-    def test_upload_single_photo_success(
+    @pytest.fixture(autouse=True)
+    def _reset_compress_image(self, compress_image):
+        """Patch compress_image for every upload test, with fresh behaviour each time."""
+        compress_image.reset_mock(return_value=True, side_effect=True)
+
+    async def test_upload_single_photo_success(
         self,
-        client,
+        aclient,
         override_get_current_user,
         mock_supabase,
         mock_supabase_response,
@@ -33,9 +107,7 @@ class TestMediaUpload:
     ):
         """Test uploading a single photo."""
         # Mock patient access verification
-        mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([mock_patient])
-        )
+        mock_supabase.table.return_value = _query_mock("select.eq", mock_supabase_response([mock_patient]))
 
         # Mock storage upload
         file_path = f"media/{mock_patient['id']}/photo.jpg"
@@ -53,11 +125,11 @@ class TestMediaUpload:
             mock_supabase_response([media_data])
         )
 
-        response = client.post(
+        response = await aclient.post(
             "/api/media/upload",
             files={"files": fake_image_upload},
             data={"patient_id": mock_patient["id"]},
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 200
@@ -65,9 +137,9 @@ class TestMediaUpload:
         assert isinstance(data["uploaded"], list)
         assert len(data["uploaded"]) > 0
 
-    def test_upload_multiple_photos_success(
+    async def test_upload_multiple_photos_success(
         self,
-        client,
+        aclient,
         override_get_current_user,
         mock_supabase,
         mock_supabase_response,
@@ -76,9 +148,7 @@ class TestMediaUpload:
     ):
         """Test uploading multiple photos at once."""
         # Mock patient access
-        mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([mock_patient])
-        )
+        mock_supabase.table.return_value = _query_mock("select.eq", mock_supabase_response([mock_patient]))
 
         # Mock storage upload
         mock_storage_service["upload_file"].return_value = f"media/{mock_patient['id']}/photo.jpg"
@@ -97,11 +167,11 @@ class TestMediaUpload:
             ("files", ("photo2.jpg", b"image2", "image/jpeg")),
         ]
 
-        response = client.post(
+        response = await aclient.post(
             "/api/media/upload",
             files=files,
             data={"patient_id": mock_patient["id"]},
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 200
@@ -109,177 +179,140 @@ class TestMediaUpload:
         assert isinstance(data["uploaded"], list)
         assert len(data["uploaded"]) >= 2
 
-    def test_upload_photo_unauthorized(self, client, mock_supabase):
-        """Test uploading photo without authentication."""
-        response = client.post(
-            "/api/media/upload",
-            files={"files": ("test.jpg", b"data", "image/jpeg")},
-            data={"patient_id": "patient-id"},
-        )
-
-        assert response.status_code == 401
-
-    def test_upload_photo_invalid_patient(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response
-    ):
-        """Test uploading photo for non-existent patient."""
-        # Mock no access
-        mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([])
-        )
-
-        response = client.post(
-            "/api/media/upload",
-            files={"files": ("test.jpg", b"data", "image/jpeg")},
-            data={"patient_id": "invalid-patient-id"},
-            headers={"Authorization": "Bearer fake-token"},
-        )
-
-        assert response.status_code == 400
-
-    def test_upload_photo_missing_patient_id(
-        self, client, override_get_current_user, mock_supabase
-    ):
-        """Test uploading photo without patient_id."""
-        response = client.post(
-            "/api/media/upload",
-            files={"files": ("test.jpg", b"data", "image/jpeg")},
-            headers={"Authorization": "Bearer fake-token"},
-        )
-
-        assert response.status_code == 422
-
-    def test_upload_photo_invalid_file_type(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_patient
+    @pytest.mark.parametrize(
+        "body,override_fixture,insert_rows,expected_status",
+        [
+            pytest.param(_REJECT_BODY, None, None, 401, id="unauthorized"),
+            # No patient row and no inserted media row, so every file fails
+            pytest.param(_REJECT_BODY, "override_get_current_user", [], 400, id="invalid-patient"),
+            pytest.param(_NO_PATIENT_BODY, "override_get_current_user", None, 422, id="missing-patient-id"),
+            # Rejected by validate_file_type before any upload is attempted
+            pytest.param(_EXE_BODY, "override_get_current_user", None, 400, id="invalid-file-type"),
+        ],
+    )
+    async def test_upload_photo_rejected(
+        self,
+        request,
+        aclient,
+        mock_supabase,
+        mock_supabase_response,
+        body,
+        override_fixture,
+        insert_rows,
+        expected_status,
     ):
-        """Test uploading invalid file type."""
-        # Mock patient access
-        mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([mock_patient])
-        )
+        """Test uploads rejected for auth, patient, form and file-type errors."""
+        headers = {"Content-Type": _MULTIPART_CONTENT_TYPE}
+        if override_fixture:
+            request.getfixturevalue(override_fixture)
+            headers.update(_AUTH_HEADERS)
+        if insert_rows is not None:
+            rows = mock_supabase_response(insert_rows)
+            mock_supabase.table.return_value = _query_mock("select.eq", rows)
+            mock_supabase.table.return_value.insert.return_value.execute.return_value = rows
 
-        response = client.post(
-            "/api/media/upload",
-            files={"files": ("test.exe", b"binary", "application/exe")},
-            data={"patient_id": mock_patient["id"]},
-            headers={"Authorization": "Bearer fake-token"},
-        )
+        response = await aclient.post("/api/media/upload", content=body, headers=headers)
 
-        # Depending on validation, might be 400 or 422
-        assert response.status_code in [400, 422]
+        assert response.status_code == expected_status
 
-    def test_upload_large_photo_compression(
+    async def test_upload_large_photo_compression(
         self,
-        client,
+        aclient,
         override_get_current_user,
         mock_supabase,
         mock_supabase_response,
         mock_patient,
-        fake_large_image_file,
-        mocker,
+        _large_image_bytes,
+        compress_image,
     ):
         """Test large photo triggers compression."""
-        # Mock compress_image at the import location in media.py (it's imported directly)
-        mock_compress = mocker.patch(
-            "app.routers.media.compress_image", new_callable=AsyncMock
-        )
-        mock_compress.return_value = b"compressed"
+        compress_image.return_value = b"compressed"
 
         # Mock media record creation
-        mock_supabase.table.return_value.insert.return_value.execute.return_value = (
-            mock_supabase_response([{"id": "media-id", "status": "pending"}])
+        mock_supabase.table.return_value = _query_mock(
+            "insert", mock_supabase_response([{"id": "media-id", "status": "pending"}])
         )
 
-        response = client.post(
+        response = await aclient.post(
             "/api/media/upload",
-            files={"files": ("large.jpg", fake_large_image_file.read(), "image/jpeg")},
+            files={"files": ("large.jpg", _large_image_bytes, "image/jpeg")},
             data={"patient_id": mock_patient["id"]},
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         # Should succeed after compression
         assert response.status_code == 200
-        mock_compress.assert_called_once()
+        compress_image.assert_called_once()
 
 
 @pytest.mark.ai
 class TestAITagging:
     """Test AI-powered photo tagging."""
 
-    def test_ai_tag_photo_success(
+    @pytest.fixture(autouse=True)
+    def _reset_analyze_image(self, analyze_image):
+        """Patch analyze_image for every tagging test, with fresh behaviour each time."""
+        analyze_image.reset_mock(return_value=True, side_effect=True)
+
+    async def test_ai_tag_photo_success(
         self,
-        client,
+        aclient,
         override_get_current_user,
         mock_supabase,
         mock_supabase_response,
         mock_media,
-        mocker,
+        analyze_image,
     ):
         """Test successful AI tagging of photo."""
         # Mock media query — endpoint uses .single()
         media_with_path = {**mock_media, "storage_path": mock_media["file_path"]}
-        mock_supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(media_with_path)
-        )
+        mock_supabase.table.return_value = _query_mock("select.eq.single", mock_supabase_response(media_with_path))
 
-        # Mock analyze_image at the import location in media.py
-        mock_analyze = mocker.patch(
-            "app.routers.media.analyze_image", new_callable=AsyncMock
-        )
-        mock_analyze.return_value = {"people": ["Family member"], "setting": "Park"}
+        analyze_image.return_value = {"people": ["Family member"], "setting": "Park"}
 
-        response = client.post(
+        response = await aclient.post(
             f"/api/media/{mock_media['id']}/ai-tag",
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 200
         data = response.json()
         assert "suggestions" in data
 
-    def test_ai_tag_photo_not_found(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response
+    async def test_ai_tag_photo_not_found(
+        self, aclient, override_get_current_user, mock_supabase, mock_supabase_response
     ):
         """Test AI tagging non-existent photo."""
-        nonexistent_id = str(uuid.uuid4())
-
         # Mock no media found — endpoint uses .single()
-        mock_supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(None)
-        )
+        mock_supabase.table.return_value = _query_mock("select.eq.single", mock_supabase_response(None))
 
-        response = client.post(
-            f"/api/media/{nonexistent_id}/ai-tag",
-            headers={"Authorization": "Bearer fake-token"},
+        response = await aclient.post(
+            f"/api/media/{_NONEXISTENT_ID}/ai-tag",
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 404
 
-    def test_ai_tag_photo_api_error(
+    async def test_ai_tag_photo_api_error(
         self,
-        client,
+        aclient,
         override_get_current_user,
         mock_supabase,
         mock_supabase_response,
         mock_media,
-        mocker,
+        analyze_image,
     ):
         """Test AI tagging when Gemini API fails."""
         # Mock media query — endpoint uses .single()
         media_with_path = {**mock_media, "storage_path": mock_media["file_path"]}
-        mock_supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(media_with_path)
-        )
+        mock_supabase.table.return_value = _query_mock("select.eq.single", mock_supabase_response(media_with_path))
 
         # Mock analyze_image to raise
-        mock_analyze = mocker.patch(
-            "app.routers.media.analyze_image", new_callable=AsyncMock
-        )
-        mock_analyze.side_effect = Exception("API rate limit exceeded")
+        analyze_image.side_effect = Exception("API rate limit exceeded")
 
-        response = client.post(
+        response = await aclient.post(
             f"/api/media/{mock_media['id']}/ai-tag",
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code in [500, 503]
@@ -289,48 +322,38 @@ class TestAITagging:
 class TestUpdateMedia:
     """Test media update endpoints."""
 
-    def test_update_media_success(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_media
+    async def test_update_media_success(
+        self, aclient, override_get_current_user, table_router, mock_supabase_response, mock_media
     ):
         """Test updating media metadata."""
         updated_media = {**mock_media, "caption": "Updated caption"}
 
         # Endpoint only queries media table: .update().eq().execute()
-        mock_media_q = MagicMock()
-        mock_media_q.update.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([updated_media])
-        )
+        table_router.register("media", _query_mock("update.eq", mock_supabase_response([updated_media])))
 
-        mock_supabase.table.side_effect = lambda name: mock_media_q if name == "media" else MagicMock()
-
-        response = client.patch(
+        response = await aclient.patch(
             f"/api/media/{mock_media['id']}",
             json={"caption": "Updated caption"},
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 200
         data = response.json()
         assert data["caption"] == "Updated caption"
 
-    def test_update_media_status_approval(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_media
+    async def test_update_media_status_approval(
+        self, aclient, override_get_current_user, table_router, mock_supabase_response, mock_media
     ):
         """Test caregiver approving pending media."""
         approved_media = {**mock_media, "status": "approved"}
 
         # Endpoint only queries media table: .update().eq().execute()
-        mock_media_q = MagicMock()
-        mock_media_q.update.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([approved_media])
-        )
+        table_router.register("media", _query_mock("update.eq", mock_supabase_response([approved_media])))
 
-        mock_supabase.table.side_effect = lambda name: mock_media_q if name == "media" else MagicMock()
-
-        response = client.patch(
+        response = await aclient.patch(
             f"/api/media/{mock_media['id']}",
             json={"status": "approved"},
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 200
@@ -342,8 +365,8 @@ class TestUpdateMedia:
 class TestMediaTags:
     """Test media tag management."""
 
-    def test_add_tag_success(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_media
+    async def test_add_tag_success(
+        self, aclient, override_get_current_user, table_router, mock_supabase_response, mock_media
     ):
         """Test adding manual tag to media."""
         tag_data = {
@@ -355,17 +378,12 @@ class TestMediaTags:
         }
 
         # Endpoint only queries media_tags table: .insert().execute()
-        mock_tags_q = MagicMock()
-        mock_tags_q.insert.return_value.execute.return_value = (
-            mock_supabase_response([tag_data])
-        )
-
-        mock_supabase.table.side_effect = lambda name: mock_tags_q if name == "media_tags" else MagicMock()
+        table_router.register("media_tags", _query_mock("insert", mock_supabase_response([tag_data])))
 
-        response = client.post(
+        response = await aclient.post(
             f"/api/media/{mock_media['id']}/tags",
             json={"tag_type": "person", "tag_value": "John Doe"},
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 200
@@ -373,21 +391,16 @@ class TestMediaTags:
         assert data["tag_value"] == "John Doe"
         assert data["tag_type"] == "person"
 
-    def test_delete_tag_success(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_media, mock_media_tag
+    async def test_delete_tag_success(
+        self, aclient, override_get_current_user, table_router, mock_supabase_response, mock_media, mock_media_tag
     ):
         """Test deleting tag from media."""
         # Endpoint only queries media_tags table: .delete().eq().eq().execute()
-        mock_tags_q = MagicMock()
-        mock_tags_q.delete.return_value.eq.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([])
-        )
-
-        mock_supabase.table.side_effect = lambda name: mock_tags_q if name == "media_tags" else MagicMock()
+        table_router.register("media_tags", _query_mock("delete.eq.eq", mock_supabase_response([])))
 
-        response = client.delete(
+        response = await aclient.delete(
             f"/api/media/{mock_media['id']}/tags/{mock_media_tag['id']}",
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 200
@@ -399,11 +412,11 @@ class TestMediaTags:
 class TestDeleteMedia:
     """Test media deletion."""
 
-    def test_delete_media_success(
+    async def test_delete_media_success(
         self,
-        client,
+        aclient,
         override_get_current_user,
-        mock_supabase,
+        table_router,
         mock_supabase_response,
         mock_media,
         mock_patient,
@@ -412,64 +425,37 @@ class TestDeleteMedia:
         # Endpoint queries two tables with .single(): media and patients
         media_data = {**mock_media, "storage_path": mock_media["file_path"]}
 
-        mock_media_query = MagicMock()
-        mock_media_query.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(media_data)
-        )
-        mock_media_query.delete.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response(None)
-        )
-
-        mock_patient_query = MagicMock()
-        mock_patient_query.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response({"caregiver_id": mock_patient["caregiver_id"]})
+        table_router.register(
+            "media", _query_mock("select.eq.single", mock_supabase_response(media_data))
+        ).register(
+            "patients",
+            _query_mock("select.eq.single", mock_supabase_response({"caregiver_id": mock_patient["caregiver_id"]})),
         )
 
-        def table_router(table_name):
-            if table_name == "media":
-                return mock_media_query
-            elif table_name == "patients":
-                return mock_patient_query
-            return MagicMock()
-
-        mock_supabase.table.side_effect = table_router
-
-        response = client.delete(
+        response = await aclient.delete(
             f"/api/media/{mock_media['id']}",
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 200
 
-    def test_delete_media_supporter_forbidden(
-        self, client, override_get_current_user_supporter, mock_supabase, mock_supabase_response, mock_media, mock_patient
+    async def test_delete_media_supporter_forbidden(
+        self, aclient, override_get_current_user_supporter, table_router, mock_supabase_response, mock_media, mock_patient
     ):
         """Test supporters cannot delete media."""
         # Endpoint queries two tables with .single(): media and patients
         media_data = {**mock_media, "storage_path": mock_media["file_path"]}
 
-        mock_media_query = MagicMock()
-        mock_media_query.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(media_data)
+        table_router.register(
+            "media", _query_mock("select.eq.single", mock_supabase_response(media_data))
+        ).register(
+            "patients",
+            _query_mock("select.eq.single", mock_supabase_response({"caregiver_id": mock_patient["caregiver_id"]})),
         )
 
-        mock_patient_query = MagicMock()
-        mock_patient_query.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response({"caregiver_id": mock_patient["caregiver_id"]})
-        )
-
-        def table_router(table_name):
-            if table_name == "media":
-                return mock_media_query
-            elif table_name == "patients":
-                return mock_patient_query
-            return MagicMock()
-
-        mock_supabase.table.side_effect = table_router
-
-        response = client.delete(
+        response = await aclient.delete(
             f"/api/media/{mock_media['id']}",
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 403
@@ -8,143 +8,121 @@ Coverage:
 - Session history
 - Schedule CRUD
 - Session curation
+
+All tests are async and share the session-scoped aclient; auth overrides and
+mock_supabase wiring are reset after each test by the conftest autouse fixtures.
 """
 
+import orjson
 import pytest
-from unittest.mock import MagicMock, AsyncMock
-from datetime import datetime, timezone
-
-
-@pytest.mark.integration
-class TestTherapySessions:
-    """Test therapy session endpoints."""
-
-    def test_start_session_success(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_patient, mocker
-    ):
-        """Test starting a therapy session."""
+from unittest.mock import patch
+
+from tests.helpers.fake_supabase import FakeQuery
+from tests.helpers.records import (  # noqa: F401 - fixtures shadow the root conftest ones
+    FIXED_TS,
+    mock_caregiver_user,
+    mock_patient,
+    mock_supporter_user,
+    mock_therapy_session,
+)
+
+# Shared request headers; httpx never mutates the dicts it is given.
+_AUTH_HEADERS = {"Authorization": "Bearer fake-token"}
+_JSON_HEADERS = {"content-type": "application/json"}
+_AUTH_JSON_HEADERS = {**_AUTH_HEADERS, **_JSON_HEADERS}
+
+# End-session body, serialized once and sent as raw content
+_END_BODY = orjson.dumps({"photos_viewed": 15, "duration": 900, "completed_naturally": True})
+
+
+@pytest.fixture(scope="class")
+def history_sessions(mock_therapy_session):
+    """Two past sessions for the history endpoint, built once per class."""
+    return [
+        dict(mock_therapy_session),
+        {
+            **mock_therapy_session,
+            "id": "session-2",
+            "photos_shown": 20,
+        },
+    ]
+
+
+async def _noop_curate_session(*args, **kwargs):
+    """curate_session stand-in; no test asserts on its calls."""
+    return []
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _stub_curate_session():
+    """Stub curate_session (imported directly in therapy.py) once for the whole module."""
+    with patch("app.routers.therapy.curate_session", _noop_curate_session):
+        yield
+
+
+@pytest.fixture
+def therapy_session_mocks(table_router, mock_supabase_response, mock_patient):
+    """
+    Route the tables start_session touches and return a session setter.
+
+    patients (.single()) finds the module patient; media and therapy_schedules
+    are empty. Call the returned function with voice_enabled to register the
+    therapy_sessions insert result.
+    """
+    (
+        table_router
+        .register("patients", FakeQuery(mock_supabase_response(dict(mock_patient))))
+        .register("media", FakeQuery(mock_supabase_response([])))
+        .register("therapy_schedules", FakeQuery(mock_supabase_response([])))
+    )
+
+    def set_session_data(voice_enabled):
         session_data = {
             "id": "session-id",
             "patient_id": mock_patient["id"],
-            "voice_enabled": False,
-            "started_at": datetime.now(timezone.utc).isoformat(),
+            "voice_enabled": voice_enabled,
+            "started_at": FIXED_TS,
             "ended_at": None,
         }
+        table_router.register("therapy_sessions", FakeQuery(mock_supabase_response([session_data])))
 
-        # Table routing: patients (.single()), therapy_sessions (insert), media, therapy_schedules
-        mock_patients_q = MagicMock()
-        mock_patients_q.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(mock_patient)
-        )
-
-        mock_sessions_q = MagicMock()
-        mock_sessions_q.insert.return_value.execute.return_value = (
-            mock_supabase_response([session_data])
-        )
-
-        mock_media_q = MagicMock()
-        mock_media_q.select.return_value.eq.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([])
-        )
-
-        mock_schedules_q = MagicMock()
-        mock_schedules_q.select.return_value.eq.return_value.limit.return_value.execute.return_value = (
-            mock_supabase_response([])
-        )
+    return set_session_data
 
-        def table_router(name):
-            if name == "patients":
-                return mock_patients_q
-            if name == "therapy_sessions":
-                return mock_sessions_q
-            if name == "media":
-                return mock_media_q
-            if name == "therapy_schedules":
-                return mock_schedules_q
-            return MagicMock()
 
-        mock_supabase.table.side_effect = table_router
+@pytest.mark.integration
+class TestTherapySessions:
+    """Test therapy session endpoints."""
 
-        # Mock curate_session (imported directly in therapy.py)
-        mocker.patch("app.routers.therapy.curate_session", new_callable=AsyncMock, return_value=[])
+    @pytest.mark.parametrize("voice_enabled", [False, True], ids=["no_voice", "voice"])
+    async def test_start_session(
+        self,
+        aclient,
+        override_get_current_user,
+        therapy_session_mocks,
+        mock_patient,
+        voice_enabled,
+    ):
+        """Test starting a therapy session, with and without voice therapy."""
+        therapy_session_mocks(voice_enabled)
 
-        response = client.post(
+        response = await aclient.post(
             "/api/therapy-sessions",
             json={
                 "patient_id": mock_patient["id"],
-                "voice_enabled": False,
+                "voice_enabled": voice_enabled,
             },
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 200
         data = response.json()
         assert data["patient_id"] == mock_patient["id"]
-        assert data["voice_enabled"] == False
+        assert data["voice_enabled"] == voice_enabled
         assert "id" in data
 
-    def test_start_session_with_voice(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_patient, mocker
-    ):
-        """Test starting session with voice therapy enabled."""
-        session_data = {
-            "id": "session-id",
-            "patient_id": mock_patient["id"],
-            "voice_enabled": True,
-            "started_at": datetime.now(timezone.utc).isoformat(),
-            "ended_at": None,
-        }
-
-        mock_patients_q = MagicMock()
-        mock_patients_q.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(mock_patient)
-        )
-
-        mock_sessions_q = MagicMock()
-        mock_sessions_q.insert.return_value.execute.return_value = (
-            mock_supabase_response([session_data])
-        )
-
-        mock_media_q = MagicMock()
-        mock_media_q.select.return_value.eq.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([])
-        )
-
-        mock_schedules_q = MagicMock()
-        mock_schedules_q.select.return_value.eq.return_value.limit.return_value.execute.return_value = (
-            mock_supabase_response([])
-        )
-
-        def table_router(name):
-            if name == "patients":
-                return mock_patients_q
-            if name == "therapy_sessions":
-                return mock_sessions_q
-            if name == "media":
-                return mock_media_q
-            if name == "therapy_schedules":
-                return mock_schedules_q
-            return MagicMock()
-
-        mock_supabase.table.side_effect = table_router
-        mocker.patch("app.routers.therapy.curate_session", new_callable=AsyncMock, return_value=[])
-
-        response = client.post(
-            "/api/therapy-sessions",
-            json={
-                "patient_id": mock_patient["id"],
-                "voice_enabled": True,
-            },
-            headers={"Authorization": "Bearer fake-token"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["voice_enabled"] == True
-
-    def test_start_session_unauthorized(self, client, mock_supabase):
+    async def test_start_session_unauthorized(self, aclient):
         """Test starting session without authentication."""
-        response = client.post(
+        response = await aclient.post(
             "/api/therapy-sessions",
             json={
                 "patient_id": "patient-id",
@@ -154,51 +132,44 @@ class TestTherapySessions:
 
         assert response.status_code == 401
 
-    def test_start_session_invalid_patient(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response
+    async def test_start_session_invalid_patient(
+        self, aclient, override_get_current_user, table_router, mock_supabase_response
     ):
         """Test starting session for non-existent patient."""
-        # verify_patient_caregiver returns no data via .single()
-        mock_supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(None)
-        )
+        # .single() finds no patient, so verify_patient_caregiver raises 404 before the 403 owner check
+        table_router.register("patients", FakeQuery(mock_supabase_response(None)))
 
-        response = client.post(
+        response = await aclient.post(
             "/api/therapy-sessions",
             json={
                 "patient_id": "invalid-patient-id",
                 "voice_enabled": False,
             },
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
-        assert response.status_code in [403, 404]
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Patient not found"
 
-    def test_end_session_success(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_therapy_session, mock_patient
+    async def test_end_session_success(
+        self, aclient, override_get_current_user, table_router, mock_supabase_response, mock_therapy_session, mock_patient
     ):
         """Test ending a therapy session with statistics."""
         # Endpoint calls .update().eq().execute() — no .single()
         ended_session = {
             "id": mock_therapy_session["id"],
             "patient_id": mock_patient["id"],
-            "ended_at": datetime.now(timezone.utc).isoformat(),
+            "ended_at": FIXED_TS,
             "photos_viewed": 15,
             "duration_seconds": 900,
             "completed_naturally": True,
         }
-        mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([ended_session])
-        )
+        table_router.register("therapy_sessions", FakeQuery(mock_supabase_response([ended_session])))
 
-        response = client.patch(
+        response = await aclient.patch(
             f"/api/therapy-sessions/{mock_therapy_session['id']}/end",
-            json={
-                "photos_viewed": 15,
-                "duration": 900,
-                "completed_naturally": True,
-            },
-            headers={"Authorization": "Bearer fake-token"},
+            content=_END_BODY,
+            headers=_AUTH_JSON_HEADERS,
         )
 
         assert response.status_code == 200
@@ -207,47 +178,31 @@ class TestTherapySessions:
         assert data["session"]["duration_seconds"] == 900
         assert data["session"]["ended_at"] is not None
 
-    def test_end_session_not_found(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response
+    async def test_end_session_not_found(
+        self, aclient, override_get_current_user, table_router, mock_supabase_response
     ):
         """Test ending non-existent session."""
         # .update().eq().execute() returns empty
-        mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([])
-        )
+        table_router.register("therapy_sessions", FakeQuery(mock_supabase_response([])))
 
-        response = client.patch(
+        response = await aclient.patch(
             "/api/therapy-sessions/non-existent-id/end",
-            json={
-                "photos_viewed": 10,
-                "duration": 600,
-                "completed_naturally": True,
-            },
-            headers={"Authorization": "Bearer fake-token"},
+            content=_END_BODY,
+            headers=_AUTH_JSON_HEADERS,
         )
 
         assert response.status_code == 404
 
-    def test_get_session_history(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_patient, mock_therapy_session
+    async def test_get_session_history(
+        self, aclient, override_get_current_user, table_router, mock_supabase_response, mock_patient, history_sessions
     ):
         """Test getting therapy session history for patient."""
         # Endpoint calls .select().eq().order().limit().execute()
-        sessions = [
-            mock_therapy_session,
-            {
-                **mock_therapy_session,
-                "id": "session-2",
-                "photos_shown": 20,
-            }
-        ]
-        mock_supabase.table.return_value.select.return_value.eq.return_value.order.return_value.limit.return_value.execute.return_value = (
-            mock_supabase_response(sessions)
-        )
+        table_router.register("therapy_sessions", FakeQuery(mock_supabase_response(history_sessions)))
 
-        response = client.get(
+        response = await aclient.get(
             f"/api/patients/{mock_patient['id']}/therapy-sessions",
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 200
@@ -262,8 +217,8 @@ class TestTherapySessions:
 class TestTherapySchedules:
     """Test therapy schedule endpoints."""
 
-    def test_create_schedule_success(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_patient
+    async def test_create_schedule_success(
+        self, aclient, override_get_current_user, table_router, mock_supabase_response, mock_patient
     ):
         """Test creating a therapy schedule."""
         schedule_data = {
@@ -275,11 +230,9 @@ class TestTherapySchedules:
                 {"day_of_week": 1, "time_of_day": "14:00", "enabled": True}
             ],
         }
-        mock_supabase.table.return_value.insert.return_value.execute.return_value = (
-            mock_supabase_response([schedule_data])
-        )
+        table_router.register("therapy_schedules", FakeQuery(mock_supabase_response([schedule_data])))
 
-        response = client.post(
+        response = await aclient.post(
             "/api/therapy-schedules",
             json={
                 "patient_id": mock_patient["id"],
@@ -293,7 +246,7 @@ class TestTherapySchedules:
                     }
                 ],
             },
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 200
@@ -301,35 +254,8 @@ class TestTherapySchedules:
         assert data["schedule"]["patient_id"] == mock_patient["id"]
         assert data["schedule"]["session_duration"] == 20
 
-    @pytest.mark.xfail(reason="Endpoint missing access check — supporters should not create schedules")
-    def test_create_schedule_supporter_forbidden(
-        self, client, override_get_current_user_supporter, mock_supabase, mock_supabase_response, mock_patient
-    ):
-        """Test supporters cannot create therapy schedules."""
-        schedule_data = {
-            "id": "schedule-id",
-            "patient_id": mock_patient["id"],
-            "session_duration": 20,
-            "sessions": [],
-        }
-        mock_supabase.table.return_value.insert.return_value.execute.return_value = (
-            mock_supabase_response([schedule_data])
-        )
-
-        response = client.post(
-            "/api/therapy-schedules",
-            json={
-                "patient_id": mock_patient["id"],
-                "session_duration": 20,
-                "sessions": [],
-            },
-            headers={"Authorization": "Bearer fake-token"},
-        )
-
-        assert response.status_code == 403
-
-    def test_get_schedule_success(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_patient
+    async def test_get_schedule_success(
+        self, aclient, override_get_current_user, table_router, mock_supabase_response, mock_patient
     ):
         """Test getting therapy schedule for patient."""
         schedule_data = {
@@ -338,30 +264,26 @@ class TestTherapySchedules:
             "session_duration": 20,
         }
         # Endpoint uses .execute() (no .single()) and returns result.data[0]
-        mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([schedule_data])
-        )
+        table_router.register("therapy_schedules", FakeQuery(mock_supabase_response([schedule_data])))
 
-        response = client.get(
+        response = await aclient.get(
             f"/api/patients/{mock_patient['id']}/therapy-schedule",
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 200
         data = response.json()
         assert data["schedule"]["patient_id"] == mock_patient["id"]
 
-    def test_get_schedule_not_found(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_patient
+    async def test_get_schedule_not_found(
+        self, aclient, override_get_current_user, table_router, mock_supabase_response, mock_patient
     ):
         """Test getting schedule when none exists — returns null schedule."""
-        mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([])
-        )
+        table_router.register("therapy_schedules", FakeQuery(mock_supabase_response([])))
 
-        response = client.get(
+        response = await aclient.get(
             f"/api/patients/{mock_patient['id']}/therapy-schedule",
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         # Endpoint returns {"schedule": None} when no schedule exists
@@ -369,37 +291,62 @@ class TestTherapySchedules:
         data = response.json()
         assert data["schedule"] is None
 
-    def test_update_schedule_success(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_patient
+    async def test_update_schedule_success(
+        self, aclient, override_get_current_user, table_router, mock_supabase_response, mock_patient
     ):
         """Test updating therapy schedule."""
-        mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([{"id": "schedule-id", "session_duration": 30}])
+        table_router.register(
+            "therapy_schedules", FakeQuery(mock_supabase_response([{"id": "schedule-id", "session_duration": 30}]))
         )
 
-        response = client.patch(
+        response = await aclient.patch(
             "/api/therapy-schedules/schedule-id",
             json={"session_duration": 30},
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 200
         data = response.json()
         assert data["message"] == "Schedule updated"
 
-    @pytest.mark.xfail(reason="Endpoint missing access check — supporters should not update schedules")
-    def test_update_schedule_supporter_forbidden(
-        self, client, override_get_current_user_supporter, mock_supabase, mock_supabase_response, mock_patient
+    @pytest.mark.xfail(
+        reason="Endpoint missing access check — supporters should not create or update schedules",
+        raises=AssertionError,
+    )
+    @pytest.mark.parametrize(
+        "method,path,payload",
+        [
+            pytest.param(
+                "post",
+                "/api/therapy-schedules",
+                {"patient_id": "patient-id", "session_duration": 20, "sessions": []},
+                id="create",
+            ),
+            pytest.param(
+                "patch", "/api/therapy-schedules/schedule-id", {"session_duration": 30}, id="update"
+            ),
+        ],
+    )
+    async def test_schedule_supporter_forbidden(
+        self,
+        aclient,
+        override_get_current_user_supporter,
+        mock_supabase,
+        mock_supabase_response,
+        method,
+        path,
+        payload,
     ):
-        """Test supporters cannot update therapy schedules."""
-        mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value = (
-            mock_supabase_response([{"id": "schedule-id"}])
-        )
+        """Test supporters cannot create or update therapy schedules."""
+        # One FakeQuery answers both the insert and the update.eq write, so the
+        # xfail comes from the missing access check, not an empty write result
+        mock_supabase.table.return_value = FakeQuery(mock_supabase_response([{"id": "schedule-id"}]))
 
-        response = client.patch(
-            "/api/therapy-schedules/schedule-id",
-            json={"session_duration": 30},
-            headers={"Authorization": "Bearer fake-token"},
+        response = await aclient.request(
+            method,
+            path,
+            json=payload,
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 403
@@ -409,31 +356,27 @@ class TestTherapySchedules:
 class TestSessionValidation:
     """Test session validation and business rules."""
 
-    def test_start_session_missing_fields(
-        self, client, override_get_current_user, mock_supabase
-    ):
+    async def test_start_session_missing_fields(self, aclient, override_get_current_user):
         """Test starting session with missing required fields."""
-        response = client.post(
+        response = await aclient.post(
             "/api/therapy-sessions",
             json={
                 # Missing patient_id
                 "voice_enabled": False,
             },
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 422
 
-    def test_end_session_missing_stats(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_therapy_session
-    ):
+    async def test_end_session_missing_stats(self, aclient, override_get_current_user, mock_therapy_session):
         """Test ending session without statistics."""
-        response = client.patch(
+        response = await aclient.patch(
             f"/api/therapy-sessions/{mock_therapy_session['id']}/end",
             json={
                 # Missing photos_viewed, duration, completed_naturally
             },
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 422
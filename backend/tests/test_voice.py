@@ -8,61 +8,76 @@ Coverage:
 
 Note: Full WebSocket testing with Gemini Live API is complex.
 This focuses on the transcript saving endpoint which is more testable.
+
+All tests are async and share the session-scoped aclient; auth overrides and
+mock_supabase wiring are reset after each test by the conftest autouse fixtures.
 """
 
+import orjson
 import pytest
-from unittest.mock import MagicMock
+
+from tests.helpers.fake_supabase import FakeQuery
+from tests.helpers.records import (  # noqa: F401 - fixtures shadow the root conftest ones
+    mock_caregiver_user,
+    mock_patient,
+    mock_supporter_user,
+    mock_therapy_session,
+)
+
+# Shared request headers; httpx never mutates the dicts it is given.
+_AUTH_HEADERS = {"Authorization": "Bearer fake-token"}
+_JSON_HEADERS = {"content-type": "application/json"}
+_AUTH_JSON_HEADERS = {**_AUTH_HEADERS, **_JSON_HEADERS}
+
+# Minimal transcript body, serialized once and sent as raw content
+_TRANSCRIPT_BODY = orjson.dumps(
+    {"transcript": [{"role": "user", "text": "Test"}], "duration": 10, "word_count": 1}
+)
+
+
+@pytest.fixture
+def voice_transcript_mocks(table_router, mock_supabase_response, mock_therapy_session, mock_patient):
+    """
+    Route the session and patient lookups save_transcript makes.
+
+    Returns the router so a test can also register voice_transcripts.
+    """
+    return (
+        table_router
+        .register(
+            "therapy_sessions",
+            FakeQuery(mock_supabase_response({"id": mock_therapy_session["id"], "patient_id": mock_patient["id"]})),
+        )
+        .register("patients", FakeQuery(mock_supabase_response({"caregiver_id": mock_patient["caregiver_id"]})))
+    )
 
 
 @pytest.mark.integration
 class TestVoiceTranscripts:
     """Test voice transcript saving endpoints."""
 
-    def test_save_transcript_success(
+    async def test_save_transcript_success(
         self,
-        client,
+        aclient,
         override_get_current_user,
-        mock_supabase,
+        voice_transcript_mocks,
         mock_supabase_response,
         mock_therapy_session,
-        mock_patient,
     ):
         """Test saving voice interaction transcript."""
         # Endpoint queries therapy_sessions and patients with .single(), then inserts voice_transcripts
-        mock_session_q = MagicMock()
-        mock_session_q.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response({"id": mock_therapy_session["id"], "patient_id": mock_patient["id"]})
-        )
-
-        mock_patient_q = MagicMock()
-        mock_patient_q.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response({"caregiver_id": mock_patient["caregiver_id"]})
-        )
-
-        mock_transcript_q = MagicMock()
-        mock_transcript_q.insert.return_value.execute.return_value = (
-            mock_supabase_response([{"id": "transcript-id"}])
+        voice_transcript_mocks.register(
+            "voice_transcripts", FakeQuery(mock_supabase_response([{"id": "transcript-id"}]))
         )
 
-        def table_router(name):
-            if name == "therapy_sessions":
-                return mock_session_q
-            if name == "patients":
-                return mock_patient_q
-            if name == "voice_transcripts":
-                return mock_transcript_q
-            return MagicMock()
-
-        mock_supabase.table.side_effect = table_router
-
-        response = client.post(
+        response = await aclient.post(
             f"/api/voice/transcript/{mock_therapy_session['id']}",
             json={
                 "transcript": [{"role": "user", "text": "Tell me about this photo."}],
                 "duration": 30,
                 "word_count": 5,
             },
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 200
@@ -70,95 +85,55 @@ class TestVoiceTranscripts:
         assert data["success"] == True
         assert "id" in data
 
-    def test_save_transcript_session_not_found(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response
+    async def test_save_transcript_session_not_found(
+        self, aclient, override_get_current_user, table_router, mock_supabase_response
     ):
         """Test saving transcript for non-existent session."""
-        mock_session_q = MagicMock()
-        mock_session_q.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(None)
-        )
-        mock_supabase.table.side_effect = lambda name: mock_session_q if name == "therapy_sessions" else MagicMock()
+        table_router.register("therapy_sessions", FakeQuery(mock_supabase_response(None)))
 
-        response = client.post(
+        response = await aclient.post(
             "/api/voice/transcript/non-existent-session",
-            json={
-                "transcript": [{"role": "user", "text": "Test"}],
-                "duration": 10,
-                "word_count": 1,
-            },
-            headers={"Authorization": "Bearer fake-token"},
+            content=_TRANSCRIPT_BODY,
+            headers=_AUTH_JSON_HEADERS,
         )
 
         assert response.status_code == 404
 
-    def test_save_transcript_unauthorized(self, client, mock_supabase):
+    async def test_save_transcript_unauthorized(self, aclient):
         """Test saving transcript without authentication."""
-        response = client.post(
+        response = await aclient.post(
             "/api/voice/transcript/session-id",
-            json={
-                "transcript": [{"role": "user", "text": "Test"}],
-                "duration": 10,
-                "word_count": 1,
-            },
+            content=_TRANSCRIPT_BODY,
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code == 401
 
-    def test_save_transcript_missing_transcript(
-        self, client, override_get_current_user, mock_supabase, mock_supabase_response, mock_therapy_session
-    ):
+    async def test_save_transcript_missing_transcript(self, aclient, override_get_current_user, mock_therapy_session):
         """Test saving transcript with missing transcript field."""
-        response = client.post(
+        response = await aclient.post(
             f"/api/voice/transcript/{mock_therapy_session['id']}",
             json={
                 # Missing transcript and duration fields
             },
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_AUTH_HEADERS,
         )
 
         assert response.status_code == 422
 
-    def test_save_transcript_supporter_forbidden(
+    async def test_save_transcript_supporter_forbidden(
         self,
-        client,
+        aclient,
         override_get_current_user_supporter,
-        mock_supabase,
-        mock_supabase_response,
+        voice_transcript_mocks,
         mock_therapy_session,
-        mock_patient,
     ):
         """Test supporters cannot save transcripts."""
         # Endpoint checks caregiver_id against current user — supporter ID won't match
-        mock_session_q = MagicMock()
-        mock_session_q.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response({"id": mock_therapy_session["id"], "patient_id": mock_patient["id"]})
-        )
-
-        mock_patient_q = MagicMock()
-        mock_patient_q.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response({"caregiver_id": mock_patient["caregiver_id"]})
-        )
-
-        def table_router(name):
-            if name == "therapy_sessions":
-                return mock_session_q
-            if name == "patients":
-                return mock_patient_q
-            return MagicMock()
-
-        mock_supabase.table.side_effect = table_router
-
-        response = client.post(
+        response = await aclient.post(
             f"/api/voice/transcript/{mock_therapy_session['id']}",
-            json={
-                "transcript": [{"role": "user", "text": "Test"}],
-                "duration": 10,
-                "word_count": 1,
-            },
-            headers={"Authorization": "Bearer fake-token"},
+            content=_TRANSCRIPT_BODY,
+            headers=_AUTH_JSON_HEADERS,
         )
 
         assert response.status_code == 403
-
-
@@ -7,32 +7,68 @@ Coverage:
 - Patient caregiver verification
 - Patient access verification (caregiver + supporter)
 - UUID validation
+
+The dependency functions are coroutines, so their tests stay async; they run
+on the session-wide event loop configured in pytest.ini, not a loop per test.
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 from fastapi import HTTPException
 
+from app.dependencies import (
+    get_current_user,
+    validate_uuid,
+    verify_patient_access,
+    verify_patient_caregiver,
+)
+from tests.helpers.fake_supabase import FakeQuery
+
+# Patient rows as seen by user-123: one they care for, one they don't, and
+# user-123's active supporter link to the latter
+_PATIENT_OWN = {"id": "patient-123", "caregiver_id": "user-123"}
+_PATIENT_OTHER = {"id": "patient-123", "caregiver_id": "other-user"}
+_SUPPORTER_OK = [{"patient_id": "patient-123", "supporter_id": "user-123"}]
+
+
+@pytest.fixture
+def mock_supabase_admin(monkeypatch):
+    """Fresh MagicMock standing in for app.dependencies.supabase_admin."""
+    mock = MagicMock()
+    monkeypatch.setattr("app.dependencies.supabase_admin", mock)
+    return mock
+
+
+@pytest.fixture
+def supabase_tables(mock_supabase_admin, mock_supabase_response):
+    """
+    Route supabase_admin.table() to the two tables the verify_* helpers read.
+
+    Call it with the patients row (None for not found) and, optionally, the
+    patient_supporters rows; any other table raises KeyError.
+    """
+
+    def route(patient, supporters=()):
+        mock_supabase_admin.table.side_effect = {
+            "patients": FakeQuery(mock_supabase_response(patient)),
+            "patient_supporters": FakeQuery(mock_supabase_response(list(supporters))),
+        }.__getitem__
+
+    return route
+
 
 @pytest.mark.unit
 @pytest.mark.auth
 class TestGetCurrentUser:
     """Test JWT authentication dependency."""
 
-    @patch("app.dependencies.supabase_admin")
-    async def test_get_current_user_valid_token(self, mock_supabase):
+    async def test_get_current_user_valid_token(self, mock_supabase_admin):
         """Test authentication with valid JWT token."""
-        from app.dependencies import get_current_user
-
-        # Mock Supabase auth.get_user response
-        mock_user = MagicMock()
-        mock_user.id = "user-123"
-        mock_user.email = "test@example.com"
-
-        mock_auth_response = MagicMock()
-        mock_auth_response.user = mock_user
-
-        mock_supabase.auth.get_user.return_value = mock_auth_response
+        # Mock Supabase auth.get_user response; only .user.id/.email are read
+        mock_supabase_admin.auth.get_user.return_value = SimpleNamespace(
+            user=SimpleNamespace(id="user-123", email="test@example.com")
+        )
 
         # Call dependency
         result = await get_current_user(token="valid-jwt-token")
@@ -41,34 +77,20 @@ class TestGetCurrentUser:
         assert result.id == "user-123"
         assert result.email == "test@example.com"
 
-    @patch("app.dependencies.supabase_admin")
-    async def test_get_current_user_invalid_token(self, mock_supabase):
-        """Test authentication with invalid JWT token."""
-        from app.dependencies import get_current_user
-
-        # Mock invalid token error
-        mock_supabase.auth.get_user.side_effect = Exception("Invalid JWT")
+    async def test_get_current_user_invalid_token(self, mock_supabase_admin):
+        """Test authentication with an invalid JWT token."""
+        # Any Supabase auth error (invalid, expired, ...) takes the same path
+        mock_supabase_admin.auth.get_user.side_effect = Exception("Invalid JWT")
 
-        # Should raise HTTPException
-        with pytest.raises((HTTPException, Exception)):
+        # Should raise HTTPException 401
+        with pytest.raises(HTTPException) as exc_info:
             await get_current_user(token="invalid-token")
 
-    @patch("app.dependencies.supabase_admin")
-    async def test_get_current_user_expired_token(self, mock_supabase):
-        """Test authentication with expired JWT token."""
-        from app.dependencies import get_current_user
-
-        # Mock expired token error
-        mock_supabase.auth.get_user.side_effect = Exception("Token expired")
-
-        with pytest.raises((HTTPException, Exception)):
-            await get_current_user(token="expired-token")
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.detail == "Authentication failed"
 
-    @patch("app.dependencies.supabase_admin")
-    async def test_get_current_user_no_token(self, mock_supabase):
+    async def test_get_current_user_no_token(self, mock_supabase_admin):
         """Test authentication without token."""
-        from app.dependencies import get_current_user
-
         # Should raise HTTPException 401 for missing token
         with pytest.raises(HTTPException) as exc_info:
             await get_current_user(token=None)
@@ -81,19 +103,10 @@ class TestGetCurrentUser:
 class TestVerifyPatientCaregiver:
     """Test patient caregiver verification."""
 
-    @patch("app.dependencies.supabase_admin")
-    async def test_verify_patient_caregiver_authorized(self, mock_supabase, mock_supabase_response):
+    async def test_verify_patient_caregiver_authorized(self, supabase_tables):
         """Test caregiver has access to their patient."""
-        from app.dependencies import verify_patient_caregiver
-
         # Mock patient fetch — source calls .table().select().eq().single().execute()
-        patient_data = {
-            "id": "patient-123",
-            "caregiver_id": "user-123",
-        }
-        mock_supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(patient_data)
-        )
+        supabase_tables(_PATIENT_OWN)
 
         # Call verification
         result = await verify_patient_caregiver(
@@ -105,19 +118,10 @@ class TestVerifyPatientCaregiver:
         assert result["id"] == "patient-123"
         assert result["caregiver_id"] == "user-123"
 
-    @patch("app.dependencies.supabase_admin")
-    async def test_verify_patient_caregiver_forbidden(self, mock_supabase, mock_supabase_response):
+    async def test_verify_patient_caregiver_forbidden(self, supabase_tables):
         """Test user is not the caregiver for patient."""
-        from app.dependencies import verify_patient_caregiver
-
         # Mock patient with different caregiver
-        patient_data = {
-            "id": "patient-123",
-            "caregiver_id": "other-user",
-        }
-        mock_supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(patient_data)
-        )
+        supabase_tables(_PATIENT_OTHER)
 
         # Should raise HTTPException 403
         with pytest.raises(HTTPException) as exc_info:
@@ -128,15 +132,10 @@ class TestVerifyPatientCaregiver:
 
         assert exc_info.value.status_code == 403
 
-    @patch("app.dependencies.supabase_admin")
-    async def test_verify_patient_caregiver_not_found(self, mock_supabase, mock_supabase_response):
+    async def test_verify_patient_caregiver_not_found(self, supabase_tables):
         """Test patient does not exist."""
-        from app.dependencies import verify_patient_caregiver
-
         # Mock no patient found — single() with empty data
-        mock_supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(None)
-        )
+        supabase_tables(None)
 
         # Should raise HTTPException 404
         with pytest.raises(HTTPException) as exc_info:
@@ -153,19 +152,10 @@ class TestVerifyPatientCaregiver:
 class TestVerifyPatientAccess:
     """Test patient access verification (caregiver or supporter)."""
 
-    @patch("app.dependencies.supabase_admin")
-    async def test_verify_patient_access_caregiver(self, mock_supabase, mock_supabase_response):
+    async def test_verify_patient_access_caregiver(self, supabase_tables):
         """Test caregiver has access."""
-        from app.dependencies import verify_patient_access
-
         # Mock patient fetch (caregiver match) — .table().select().eq().single().execute()
-        patient_data = {
-            "id": "patient-123",
-            "caregiver_id": "user-123",
-        }
-        mock_supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(patient_data)
-        )
+        supabase_tables(_PATIENT_OWN)
 
         # Call verification
         result = await verify_patient_access(
@@ -176,44 +166,12 @@ class TestVerifyPatientAccess:
         # Should return patient data
         assert result["id"] == "patient-123"
 
-    @patch("app.dependencies.supabase_admin")
-    async def test_verify_patient_access_supporter(self, mock_supabase, mock_supabase_response):
+    async def test_verify_patient_access_supporter(self, supabase_tables):
         """Test supporter has access."""
-        from app.dependencies import verify_patient_access
-
-        # Need separate mocks for two different table() calls:
+        # Need separate queries for two different table() calls:
         # 1. patients: .table('patients').select().eq().single().execute()
         # 2. patient_supporters: .table('patient_supporters').select().eq().eq().is_().execute()
-
-        patient_data = {
-            "id": "patient-123",
-            "caregiver_id": "other-user",
-        }
-        supporter_data = [
-            {
-                "patient_id": "patient-123",
-                "supporter_id": "user-123",
-            }
-        ]
-
-        mock_patient_query = MagicMock()
-        mock_patient_query.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(patient_data)
-        )
-
-        mock_supporter_query = MagicMock()
-        mock_supporter_query.select.return_value.eq.return_value.eq.return_value.is_.return_value.execute.return_value = (
-            mock_supabase_response(supporter_data)
-        )
-
-        def table_router(table_name):
-            if table_name == "patients":
-                return mock_patient_query
-            elif table_name == "patient_supporters":
-                return mock_supporter_query
-            return MagicMock()
-
-        mock_supabase.table.side_effect = table_router
+        supabase_tables(_PATIENT_OTHER, _SUPPORTER_OK)
 
         # Call verification
         result = await verify_patient_access(
@@ -224,34 +182,10 @@ class TestVerifyPatientAccess:
         # Should return patient data
         assert result["id"] == "patient-123"
 
-    @patch("app.dependencies.supabase_admin")
-    async def test_verify_patient_access_forbidden(self, mock_supabase, mock_supabase_response):
+    async def test_verify_patient_access_forbidden(self, supabase_tables):
         """Test user has no access to patient."""
-        from app.dependencies import verify_patient_access
-
-        patient_data = {
-            "id": "patient-123",
-            "caregiver_id": "other-user",
-        }
-
-        mock_patient_query = MagicMock()
-        mock_patient_query.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            mock_supabase_response(patient_data)
-        )
-
-        mock_supporter_query = MagicMock()
-        mock_supporter_query.select.return_value.eq.return_value.eq.return_value.is_.return_value.execute.return_value = (
-            mock_supabase_response([])
-        )
-
-        def table_router(table_name):
-            if table_name == "patients":
-                return mock_patient_query
-            elif table_name == "patient_supporters":
-                return mock_supporter_query
-            return MagicMock()
-
-        mock_supabase.table.side_effect = table_router
+        # No active supporter link for this user
+        supabase_tables(_PATIENT_OTHER)
 
         # Should raise HTTPException 403
         with pytest.raises(HTTPException) as exc_info:
@@ -267,32 +201,20 @@ class TestVerifyPatientAccess:
 class TestUUIDValidation:
     """Test UUID validation helper."""
 
-    def test_valid_uuid(self):
-        """Test validation of valid UUID."""
-        from app.dependencies import validate_uuid
-
-        valid_uuid = "123e4567-e89b-12d3-a456-426614174000"
-
-        # Should not raise error and should return the validated UUID string
-        result = validate_uuid(valid_uuid)
-
-        assert result == valid_uuid
-
-    def test_invalid_uuid(self):
-        """Test validation of invalid UUID."""
-        from app.dependencies import validate_uuid
-
-        invalid_uuid = "not-a-valid-uuid"
-
-        # Should raise HTTPException or return False
-        with pytest.raises((HTTPException, ValueError, Exception)):
-            validate_uuid(invalid_uuid)
-
-    def test_uuid_wrong_format(self):
-        """Test UUID with wrong format."""
-        from app.dependencies import validate_uuid
-
-        wrong_format = "12345678-1234-1234-1234"  # Missing section
-
-        with pytest.raises((HTTPException, ValueError, Exception)):
-            validate_uuid(wrong_format)
+    @pytest.mark.parametrize(
+        "value, valid",
+        [
+            pytest.param("123e4567-e89b-12d3-a456-426614174000", True, id="valid"),
+            pytest.param("not-a-valid-uuid", False, id="not-a-uuid"),
+            pytest.param("12345678-1234-1234-1234", False, id="missing-section"),
+        ],
+    )
+    def test_validate_uuid(self, value, valid):
+        """Test validate_uuid returns well-formed UUIDs and rejects malformed ones."""
+        if valid:
+            assert validate_uuid(value) == value
+        else:
+            with pytest.raises(HTTPException) as exc_info:
+                validate_uuid(value)
+
+            assert exc_info.value.status_code == 400
@@ -13,6 +13,40 @@ Coverage:
 import pytest
 from pydantic import ValidationError
 
+from app.models.schemas import (
+    InvitationCreate,
+    MediaReview,
+    MediaStatus,
+    MediaTagCreate,
+    PatientCreate,
+    PatientSettingsUpdate,
+    ScheduleSessionItem,
+    TagSuggestion,
+    TagType,
+    TherapySessionCreate,
+    UserRegister,
+)
+
+# Valid payloads; tests copy and override a single field to make them invalid
+_BASE_USER = {
+    "email": "test@example.com",
+    "password": "SecurePassword123!",
+    "full_name": "John Doe",
+    "role": "caregiver",
+}
+_BASE_PATIENT = {
+    "first_name": "Mary",
+    "last_name": "Smith",
+    "birth_date": "1945-06-15",
+    "relationship": "Mother",
+}
+
+
+@pytest.fixture(scope="module")
+def valid_patient():
+    """PatientCreate validated once from _BASE_PATIENT; tests only read it."""
+    return PatientCreate(**_BASE_PATIENT)
+
 
 @pytest.mark.unit
 class TestUserSchemas:
@@ -20,77 +54,30 @@ class TestUserSchemas:
 
     def test_user_register_valid(self):
         """Test valid user registration data."""
-        from app.models.schemas import UserRegister
-
-        data = {
-            "email": "test@example.com",
-            "password": "SecurePassword123!",
-            "full_name": "John Doe",
-            "role": "caregiver",
-        }
-
-        user = UserRegister(**data)
+        user = UserRegister(**_BASE_USER)
 
         assert user.email == "test@example.com"
         assert user.full_name == "John Doe"
         assert user.role == "caregiver"
 
-    def test_user_register_invalid_email(self):
-        """Test registration with invalid email format."""
-        from app.models.schemas import UserRegister
-
-        data = {
-            "email": "not-an-email",
-            "password": "SecurePassword123!",
-            "full_name": "John Doe",
-            "role": "caregiver",
-        }
-
-        with pytest.raises(ValidationError) as exc_info:
-            UserRegister(**data)
-
-        assert "email" in str(exc_info.value).lower()
-
-    def test_user_register_weak_password(self):
-        """Test registration with weak password."""
-        from app.models.schemas import UserRegister
-
-        data = {
-            "email": "test@example.com",
-            "password": "123",  # Too short
-            "full_name": "John Doe",
-            "role": "caregiver",
-        }
-
+    @pytest.mark.parametrize(
+        "override, field",
+        [
+            pytest.param({"email": "not-an-email"}, "email", id="bad-email"),
+            pytest.param({"password": "123"}, "password", id="weak-password"),
+            pytest.param({"role": "admin"}, "role", id="bad-role"),
+        ],
+    )
+    def test_user_register_invalid(self, override, field):
+        """Test registration rejects an invalid email, weak password or unknown role."""
         with pytest.raises(ValidationError) as exc_info:
-            UserRegister(**data)
-
-        assert "password" in str(exc_info.value).lower()
+            UserRegister(**{**_BASE_USER, **override})
 
-    def test_user_register_invalid_role(self):
-        """Test registration with invalid role."""
-        from app.models.schemas import UserRegister
-
-        data = {
-            "email": "test@example.com",
-            "password": "SecurePassword123!",
-            "full_name": "John Doe",
-            "role": "admin",  # Invalid role
-        }
-
-        with pytest.raises(ValidationError) as exc_info:
-            UserRegister(**data)
-
-        assert "role" in str(exc_info.value).lower()
+        assert (field,) in [err["loc"] for err in exc_info.value.errors()]
 
     def test_user_register_missing_fields(self):
         """Test registration with missing required fields."""
-        from app.models.schemas import UserRegister
-
-        data = {
-            "email": "test@example.com",
-            # Missing password, full_name, role
-        }
+        data = {"email": _BASE_USER["email"]}  # Missing password, full_name, role
 
         with pytest.raises(ValidationError):
             UserRegister(**data)
@@ -100,55 +87,36 @@ class TestUserSchemas:
 class TestPatientSchemas:
     """Test patient-related schema validation."""
 
-    def test_patient_create_valid(self):
+    def test_patient_create_valid(self, valid_patient):
         """Test valid patient creation data."""
-        from app.models.schemas import PatientCreate
-
-        data = {
-            "first_name": "Mary",
-            "last_name": "Smith",
-            "birth_date": "1945-06-15",
-            "relationship": "Mother",
-        }
-
-        patient = PatientCreate(**data)
-
-        assert patient.first_name == "Mary"
-        assert patient.last_name == "Smith"
-        assert patient.relationship == "Mother"
+        assert valid_patient.first_name == "Mary"
+        assert valid_patient.last_name == "Smith"
+        assert valid_patient.relationship == "Mother"
 
     def test_patient_create_invalid_date(self):
         """Test patient creation with invalid date format."""
-        from app.models.schemas import PatientCreate
-
-        data = {
-            "first_name": "Mary",
-            "last_name": "Smith",
-            "birth_date": "not-a-date",
-            "relationship": "Mother",
-        }
+        data = {**_BASE_PATIENT, "birth_date": "not-a-date"}
 
         with pytest.raises(ValidationError) as exc_info:
             PatientCreate(**data)
 
-        assert "date" in str(exc_info.value).lower()
-
-    def test_patient_settings_pin_validation(self):
+        assert ("birth_date",) in [err["loc"] for err in exc_info.value.errors()]
+
+    @pytest.mark.parametrize(
+        "pin, valid",
+        [
+            pytest.param("1234", True, id="four-digits"),
+            pytest.param("12", False, id="too-short"),
+            pytest.param("abcd", False, id="not-numeric"),
+        ],
+    )
+    def test_patient_settings_pin_validation(self, pin, valid):
         """Test patient settings PIN format validation."""
-        from app.models.schemas import PatientSettingsUpdate
-
-        # Valid 4-digit PIN
-        data = {"settings_pin": "1234"}
-        settings = PatientSettingsUpdate(**data)
-        assert settings.settings_pin == "1234"
-
-        # Invalid PIN (too short)
-        with pytest.raises(ValidationError):
-            PatientSettingsUpdate(settings_pin="12")
-
-        # Invalid PIN (not numeric)
-        with pytest.raises(ValidationError):
-            PatientSettingsUpdate(settings_pin="abcd")
+        if valid:
+            assert PatientSettingsUpdate(settings_pin=pin).settings_pin == pin
+        else:
+            with pytest.raises(ValidationError):
+                PatientSettingsUpdate(settings_pin=pin)
 
 
 @pytest.mark.unit
@@ -157,8 +125,6 @@ class TestMediaSchemas:
 
     def test_media_status_enum(self):
         """Test media status enum values."""
-        from app.models.schemas import MediaStatus
-
         # Valid statuses
         assert MediaStatus.pending.value == "pending"
         assert MediaStatus.approved.value == "approved"
@@ -169,8 +135,6 @@ class TestMediaSchemas:
 
     def test_tag_type_enum(self):
         """Test tag type enum values."""
-        from app.models.schemas import TagType
-
         # Valid types
         assert TagType.person.value == "person"
         assert TagType.place.value == "place"
@@ -180,8 +144,6 @@ class TestMediaSchemas:
 
     def test_media_review_valid(self):
         """Test valid media review data."""
-        from app.models.schemas import MediaReview
-
         data = {
             "action": "approve",
         }
@@ -189,26 +151,12 @@ class TestMediaSchemas:
         review = MediaReview(**data)
         assert review.action == "approve"
 
-    def test_tag_suggestion_confidence(self):
+    # Any float is accepted (no bounds validation on confidence)
+    @pytest.mark.parametrize("confidence", [0.95, 1.5, -0.5])
+    def test_tag_suggestion_confidence(self, confidence):
         """Test tag suggestion confidence values."""
-        from app.models.schemas import TagSuggestion
-
-        # Valid confidence
-        data = {
-            "type": "person",
-            "value": "John Doe",
-            "confidence": 0.95,
-        }
-
-        tag = TagSuggestion(**data)
-        assert tag.confidence == 0.95
-
-        # Any float is accepted (no bounds validation on confidence)
-        tag_high = TagSuggestion(type="person", value="Test", confidence=1.5)
-        assert tag_high.confidence == 1.5
-
-        tag_low = TagSuggestion(type="person", value="Test", confidence=-0.5)
-        assert tag_low.confidence == -0.5
+        tag = TagSuggestion(type="person", value="John Doe", confidence=confidence)
+        assert tag.confidence == confidence
 
 
 @pytest.mark.unit
@@ -217,8 +165,6 @@ class TestTherapySchemas:
 
     def test_therapy_session_create_valid(self):
         """Test valid therapy session creation."""
-        from app.models.schemas import TherapySessionCreate
-
         data = {
             "patient_id": "123e4567-e89b-12d3-a456-426614174000",
             "voice_enabled": True,
@@ -229,8 +175,6 @@ class TestTherapySchemas:
 
     def test_therapy_schedule_time_format(self):
         """Test therapy schedule time format validation."""
-        from app.models.schemas import ScheduleSessionItem
-
         # Valid time format (HH:MM)
         data = {
             "day_of_week": 1,
@@ -245,22 +189,18 @@ class TestTherapySchemas:
         with pytest.raises(ValidationError):
             ScheduleSessionItem(day_of_week=1, time_of_day="2:30 PM", enabled=True)
 
-    def test_therapy_schedule_day_of_week(self):
+    @pytest.mark.parametrize(
+        "day, valid",
+        [(day, True) for day in range(7)] + [(-1, False), (7, False)],
+    )
+    def test_therapy_schedule_day_of_week(self, day, valid):
         """Test day of week validation (0-6)."""
-        from app.models.schemas import ScheduleSessionItem
-
-        # Valid days (0-6)
-        for day in range(7):
+        if valid:
             schedule = ScheduleSessionItem(day_of_week=day, time_of_day="10:00", enabled=True)
             assert schedule.day_of_week == day
-
-        # Invalid day (< 0)
-        with pytest.raises(ValidationError):
-            ScheduleSessionItem(day_of_week=-1, time_of_day="10:00", enabled=True)
-
-        # Invalid day (> 6)
-        with pytest.raises(ValidationError):
-            ScheduleSessionItem(day_of_week=7, time_of_day="10:00", enabled=True)
+        else:
+            with pytest.raises(ValidationError):
+                ScheduleSessionItem(day_of_week=day, time_of_day="10:00", enabled=True)
 
 
 @pytest.mark.unit
@@ -269,8 +209,6 @@ class TestInvitationSchemas:
 
     def test_invitation_create_valid(self):
         """Test valid invitation creation."""
-        from app.models.schemas import InvitationCreate
-
         data = {
             "patient_id": "123e4567-e89b-12d3-a456-426614174000",
             "email": "supporter@example.com",
@@ -282,8 +220,6 @@ class TestInvitationSchemas:
 
     def test_invitation_create_invalid_email(self):
         """Test invitation with invalid email."""
-        from app.models.schemas import InvitationCreate
-
         data = {
             "patient_id": "123e4567-e89b-12d3-a456-426614174000",
             "email": "not-an-email",
@@ -292,7 +228,7 @@ class TestInvitationSchemas:
         with pytest.raises(ValidationError) as exc_info:
             InvitationCreate(**data)
 
-        assert "email" in str(exc_info.value).lower()
+        assert ("email",) in [err["loc"] for err in exc_info.value.errors()]
 
 
 @pytest.mark.unit
@@ -301,8 +237,6 @@ class TestDataSanitization:
 
     def test_sanitize_control_characters(self):
         """Test removal of control characters from validated input."""
-        from app.models.schemas import MediaTagCreate
-
         # MediaTagCreate has a field_validator that strips control characters
         tag = MediaTagCreate(tag_type="person", tag_value="John\x00Doe\x1b[31m")
         assert "\x00" not in tag.tag_value
@@ -314,26 +248,14 @@ class TestDataSanitization:
 class TestOptionalFields:
     """Test optional field handling."""
 
-    def test_patient_create_optional_photo(self):
-        """Test patient creation with optional photo URL."""
-        from app.models.schemas import PatientCreate
-
-        # Without photo
-        data = {
-            "first_name": "Mary",
-            "last_name": "Smith",
-            "birth_date": "1945-06-15",
-            "relationship": "Mother",
-        }
-
-        patient = PatientCreate(**data)
-        assert patient.first_name == "Mary"
-        # photo_url should be optional/None
+    def test_patient_create_optional_photo(self, valid_patient):
+        """Test patient creation without a photo URL."""
+        # The photo is uploaded separately, so PatientCreate has no photo_url
+        assert valid_patient.first_name == "Mary"
+        assert "photo_url" not in valid_patient.model_dump()
 
     def test_media_optional_caption(self):
         """Test media review with optional rejection reason."""
-        from app.models.schemas import MediaReview
-
         # Without rejection_reason
         data = {"action": "approve"}
 